@@ -0,0 +1,53 @@
+"""Unique index on lower(word)
+
+Revision ID: a3c9e1f47b20
+Revises: 5f5fb82d0d66
+Create Date: 2026-10-15 10:12:41.503917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c9e1f47b20'
+down_revision: Union[str, None] = '5f5fb82d0d66'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Keeps the lowest id of each group of words differing only by case
+_DUPLICATES = (
+    "(SELECT id, min(id) OVER (PARTITION BY lower(word)) AS keep_id FROM words) d"
+)
+
+
+def upgrade() -> None:
+    # Merge words differing only by case into the one with the lowest id so
+    # the index can be built. Progress rows that would collide after the
+    # merge keep the row of the lowest word id for each user.
+    op.execute(
+        "DELETE FROM user_word_progress p USING words w "
+        "WHERE p.word_id = w.id AND EXISTS ("
+        "SELECT 1 FROM user_word_progress q JOIN words v ON v.id = q.word_id "
+        "WHERE q.user_id = p.user_id AND lower(v.word) = lower(w.word) "
+        "AND q.word_id < p.word_id)"
+    )
+    for table in ("user_word_progress", "word_edit_history"):
+        op.execute(
+            f"UPDATE {table} t SET word_id = d.keep_id FROM {_DUPLICATES} "
+            "WHERE t.word_id = d.id AND d.id <> d.keep_id"
+        )
+    op.execute(
+        f"DELETE FROM words w USING {_DUPLICATES} "
+        "WHERE w.id = d.id AND d.id <> d.keep_id"
+    )
+    
+    # Case-insensitive uniqueness; Excel imports rely on it for ON CONFLICT DO NOTHING.
+    op.create_index('uq_words_word_lower', 'words', [sa.text('lower(word)')], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_words_word_lower', table_name='words')
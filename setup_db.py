@@ -10,22 +10,41 @@ from pathlib import Path
 # Add the project root to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.database import init_db
 from src.config import DATABASE_URL
 
+_BANNER = "=" * 50
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Create a uvloop event loop if available, else the default one."""
+    if sys.platform == "win32":
+        return asyncio.new_event_loop()
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
 
 async def setup_database():
     """Initialize database tables"""
-    print("=" * 50)
+    print(_BANNER)
     print("English Learning Bot - Database Setup")
-    print("=" * 50)
+    print(_BANNER)
     print()
     print(f"Database URL: {DATABASE_URL}")
     print()
     
+    # Imported here so the ORM module graph loads only when setup actually runs
+    from src.database import init_db, create_unpooled_engine
+    from src.logger import configure_logging
+    
+    configure_logging()
+    
+    engine = create_unpooled_engine()
     try:
         print("Creating database tables...")
-        await init_db()
+        await init_db(engine)
         print("✅ Database tables created successfully!")
         print()
         print("Next steps:")
@@ -41,7 +60,10 @@ async def setup_database():
         print("2. DATABASE_URL in .env is correct")
         print("3. Database exists (CREATE DATABASE english_bot;)")
         sys.exit(1)
+    finally:
+        await engine.dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(setup_database())
+    with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+        runner.run(setup_database())
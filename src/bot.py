@@ -7,6 +7,12 @@ This module is the entry point for the Telegram bot, handling:
 - Lifecycle management (startup/shutdown)
 """
 
+import asyncio
+import importlib.util
+import logging
+import sys
+from typing import Any, Awaitable, Callable
+
 from telegram import Update
 from telegram.ext import (
     Application,
@@ -14,26 +20,28 @@ from telegram.ext import (
     MessageHandler,
     CallbackQueryHandler,
     ConversationHandler,
-    filters,
     ContextTypes,
 )
 
-from src.config import TELEGRAM_BOT_TOKEN
+from src.config import (
+    TELEGRAM_BOT_TOKEN,
+    WEBHOOK_URL,
+    WEBHOOK_LISTEN,
+    WEBHOOK_PORT,
+    WEBHOOK_SECRET_TOKEN,
+    CONCURRENT_UPDATES,
+)
 from src.database import init_db, close_db
 from src.scheduler import setup_daily_reminder
-from src.logger import setup_logger
+from src.filters import TEXT_NOT_COMMAND
+from src.logger import configure_logging
+from src.update_processor import UserSerializingUpdateProcessor
 
 # Import constants
-from src.constants import ConversationState, ButtonText, SessionKey
-
-# Import callback patterns
-from src.callback_data import (
-    AnswerCallback,
-    DifficultyCallback,
-    NavigationCallback,
-    StartLearningCallback,
-    EditFieldCallback,
-)
+from src.constants import ConversationState, ButtonText, SessionKey, CallbackAction
+
+# Import callback data helpers
+from src.callback_data import CALLBACK_SEPARATOR
 
 # Import handlers
 from src.handlers import (
@@ -65,18 +73,57 @@ from src.handlers import (
 )
 
 # Import conversation handlers
-from src.conversations import (
-    create_start_conversation,
-    create_add_words_conversation,
-    create_edit_word_conversation,
-    create_settings_conversation,
-)
+from src.conversations import CONVERSATION_FACTORIES
 
 from src.keyboards import get_main_menu_keyboard
-from src.handlers.base import get_session_value, set_session_value, clear_session_data
+from src.handlers.base import release_user_data
+
+logger = logging.getLogger(__name__)
+
+# Main menu buttons that are not ConversationHandler entry points.
+# Entry-point buttons ("➕ Add Words", "✏️ Edit Word", "⚙️ Settings") are
+# consumed by their conversations and never reach the fallback handler.
+_TEXT_ROUTES: dict[str, Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[Any]]] = {
+    ButtonText.START_LEARNING: start_learning,
+    ButtonText.MY_PROGRESS: show_progress,
+    ButtonText.SAMPLE_EXCEL: send_sample_excel,
+}
+
+# The main menu never changes, so build its markup once
+_MAIN_MENU_MARKUP = get_main_menu_keyboard()
+
+# Inline button callback prefix -> handler, for buttons outside conversations.
+# Settings buttons are routed by the settings ConversationHandler instead.
+_CALLBACK_ROUTES: dict[str, Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[Any]]] = {
+    "answer": handle_answer,
+    "difficulty": handle_difficulty,
+    "next": handle_next_word,
+    "start": start_learning,
+    "edit": handle_edit_field_selection,
+}
 
-logger = setup_logger(__name__)
+# Update types the registered handlers consume; Telegram sends nothing else
+ALLOWED_UPDATES = [Update.MESSAGE, Update.CALLBACK_QUERY]
 
+# Maximum number of fetched updates waiting to be processed. When full,
+# fetching pauses until handlers catch up instead of buffering without bound.
+UPDATE_QUEUE_SIZE = 1000
+
+# Parallel webhook connections Telegram may open to deliver updates; no
+# point exceeding what is processed concurrently (Telegram allows 1-100)
+WEBHOOK_MAX_CONNECTIONS = min(CONCURRENT_UPDATES, 100)
+
+# Connections kept open to the Bot API. Handlers and the daily reminder job
+# all send through application.bot, so they share this one pool; it covers
+# one connection per concurrent handler plus headroom for the reminder job
+# and handlers overlapping two requests (e.g. answering a callback query
+# while replying). Follows CONCURRENT_UPDATES so raising it cannot starve
+# the pool.
+_BOT_API_HEADROOM = 32
+CONNECTION_POOL_SIZE = CONCURRENT_UPDATES + _BOT_API_HEADROOM
+
+# Multiplex requests over a single HTTP/2 connection when h2 is installed
+HTTP_VERSION = "2" if importlib.util.find_spec("h2") else "1.1"
 
 async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
@@ -94,43 +141,76 @@ async def handle_text_message(update: Update, context: ContextTypes.DEFAULT_TYPE
     text = update.message.text
     
     # Route based on button text
-    if text == ButtonText.START_LEARNING:
-        await start_learning(update, context)
-        
-    elif text == ButtonText.MY_PROGRESS:
-        await show_progress(update, context)
-        
-    elif text == ButtonText.SAMPLE_EXCEL:
-        await send_sample_excel(update, context)
-        
-        
+    handler = _TEXT_ROUTES.get(text)
+    if handler is not None:
+        await handler(update, context)
+    
     else:
         # Check if user is in edit mode (waiting for new value)
-        edit_field = context.user_data.get(SessionKey.EDIT_FIELD.value) if context.user_data else None
+        edit_field = context.user_data.get(SessionKey.EDIT_FIELD) if context.user_data else None
         if edit_field:
             await handle_edit_value(update, context)
         else:
             # Unknown message - show help
             await update.message.reply_text(
                 "I didn't understand that. Please use the menu buttons below.",
-                reply_markup=get_main_menu_keyboard()
+                reply_markup=_MAIN_MENU_MARKUP
             )
+            # The edit-mode probe above created an empty entry for this user
+            release_user_data(update, context)
     
     return ConversationHandler.END
 
 
+def _is_routed_callback(data: object) -> bool:
+    """
+    Tell whether callback data is a valid action for a _CALLBACK_ROUTES handler.
+    
+    Fixed actions are checked with one frozenset lookup; difficulty data
+    carries a word id and is validated by its own decoder. Anything else
+    (stale or forged data) is left to the catch-all handler.
+    """
+    if not isinstance(data, str):
+        return False
+    prefix = data.partition(CALLBACK_SEPARATOR)[0]
+    if prefix not in _CALLBACK_ROUTES:
+        return False
+    return data in CallbackAction.ALL_VALUES or prefix == "difficulty"
+
+
+async def route_callback_query(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """
+    Route inline button presses to the matching handler by callback prefix.
+    
+    A single handler with a dict lookup replaces one regex-matched
+    CallbackQueryHandler per button type.
+    """
+    query = update.callback_query
+    prefix = (query.data or "").partition(CALLBACK_SEPARATOR)[0]
+    
+    handler = _CALLBACK_ROUTES.get(prefix)
+    if handler is not None:
+        await handler(update, context)
+    else:
+        await answer_unhandled_callback(update, context)
+
+
+async def answer_unhandled_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Answer a stale or unknown button press so its loading spinner stops."""
+    await update.callback_query.answer()
+
+
 async def post_init(application: Application):
     """
     Initialize resources after the bot starts.
     
     - Initializes database connection and tables
-    - Sets up the daily reminder scheduler
+    
+    The daily reminder job is registered in create_application() so that
+    only database initialization runs before the bot starts serving updates.
     """
     logger.info("Initializing database...")
     await init_db()
-    
-    logger.info("Setting up daily reminders...")
-    setup_daily_reminder(application)
     logger.info("Bot initialization complete!")
 
 
@@ -150,58 +230,47 @@ def register_handlers(application: Application) -> None:
     Register all handlers with the application.
     
     Handler registration order is important:
-    1. ConversationHandlers (highest priority, consume matching updates)
-    2. Command handlers
-    3. Callback query handlers (for inline buttons)
-    4. Text message fallback handler (lowest priority)
+    1. Callback query router for learning/edit buttons (the most frequent
+       updates; no conversation claims these prefixes)
+    2. ConversationHandlers (consume matching updates)
+    3. Command handlers
+    4. Catch-all callback query handler (stale or unknown buttons)
+    5. Text message fallback handler (lowest priority)
     """
     
-    # --- 1. Conversation Handlers ---
-    # These must be registered first to properly consume their entry point messages
+    # --- 1. Callback Query Router ---
+    # Checked first so button taps skip every ConversationHandler check.
+    # Settings buttons are left to the settings conversation.
+    
+    application.add_handler(
+        CallbackQueryHandler(route_callback_query, pattern=_is_routed_callback)
+    )
+    
+    # --- 2. Conversation Handlers ---
+    # Registered before commands and fallbacks to consume their entry point messages
     
-    application.add_handler(create_start_conversation())
-    application.add_handler(create_add_words_conversation())
-    application.add_handler(create_edit_word_conversation())
-    application.add_handler(create_settings_conversation())
+    for create_conversation in CONVERSATION_FACTORIES:
+        application.add_handler(create_conversation())
     
-    # --- 2. Command Handlers ---
+    # --- 3. Command Handlers ---
     
     application.add_handler(CommandHandler("sample", send_sample_excel))
     application.add_handler(CommandHandler("progress", show_progress))
     application.add_handler(CommandHandler("learn", start_learning))
     
-    # --- 3. Callback Query Handlers ---
-    # For inline buttons outside of conversation handlers
-    
-    # Learning flow callbacks
-    application.add_handler(
-        CallbackQueryHandler(handle_answer, pattern=AnswerCallback.pattern())
-    )
-    application.add_handler(
-        CallbackQueryHandler(handle_difficulty, pattern=DifficultyCallback.pattern())
-    )
-    application.add_handler(
-        CallbackQueryHandler(handle_next_word, pattern=NavigationCallback.pattern())
-    )
-    
-    # Start learning from reminder
-    application.add_handler(
-        CallbackQueryHandler(start_learning, pattern=StartLearningCallback.pattern())
-    )
+    # --- 4. Catch-all Callback Query Handler ---
+    # Answers buttons no other handler claimed so their spinner stops
     
-    # Edit word field selection
-    application.add_handler(
-        CallbackQueryHandler(handle_edit_field_selection, pattern=EditFieldCallback.pattern())
-    )
+    application.add_handler(CallbackQueryHandler(answer_unhandled_callback))
     
-    # --- 4. Text Message Fallback Handler ---
+    # --- 5. Text Message Fallback Handler ---
     # MUST be last - catches all unhandled text messages
     
     application.add_handler(
-        MessageHandler(filters.TEXT & ~filters.COMMAND, handle_text_message)
+        MessageHandler(TEXT_NOT_COMMAND, handle_text_message)
     )
     
-    # --- 5. Error Handler ---
+    # --- 6. Error Handler ---
     
     application.add_error_handler(error_handler)
     
@@ -226,6 +295,11 @@ def create_application() -> Application:
     application = (
         Application.builder()
         .token(TELEGRAM_BOT_TOKEN)
+        .connection_pool_size(CONNECTION_POOL_SIZE)
+        .http_version(HTTP_VERSION)
+        # Concurrent across users, in order for each user
+        .concurrent_updates(UserSerializingUpdateProcessor(CONCURRENT_UPDATES))
+        .update_queue(asyncio.Queue(maxsize=UPDATE_QUEUE_SIZE))
         .build()
     )
     
@@ -236,29 +310,68 @@ def create_application() -> Application:
     # Register handlers
     register_handlers(application)
     
+    # Schedule daily reminders; the job queue picks the job up when it starts
+    logger.info("Setting up daily reminders...")
+    setup_daily_reminder(application)
+    
     return application
 
 
+def install_event_loop_policy() -> None:
+    """
+    Use uvloop as the asyncio event loop when it is installed.
+    
+    Must be called before the application creates its event loop.
+    uvloop does not support Windows, where the default loop is kept.
+    """
+    if sys.platform == "win32":
+        return
+    
+    try:
+        import uvloop
+    except ImportError:
+        return
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
+
 def run_bot() -> None:
     """
     Run the bot.
     
-    Creates the application and starts polling for updates.
+    Creates the application and starts receiving updates, either through
+    a webhook (when WEBHOOK_URL is set) or by long polling.
     This function blocks until the bot is stopped.
     """
+    configure_logging()
     logger.info("Starting English Learning Bot...")
     
     try:
+        install_event_loop_policy()
         application = create_application()
         
-        # Start polling with all update types enabled
-        application.run_polling(
-            allowed_updates=Update.ALL_TYPES,
-            drop_pending_updates=True  # Ignore updates that arrived while bot was offline
-        )
+        if WEBHOOK_URL:
+            # Telegram pushes updates to us; the token path keeps the URL private
+            application.run_webhook(
+                listen=WEBHOOK_LISTEN,
+                port=WEBHOOK_PORT,
+                url_path=TELEGRAM_BOT_TOKEN,
+                webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{TELEGRAM_BOT_TOKEN}",
+                secret_token=WEBHOOK_SECRET_TOKEN,
+                max_connections=WEBHOOK_MAX_CONNECTIONS,
+                allowed_updates=ALLOWED_UPDATES,
+                drop_pending_updates=True,
+            )
+        else:
+            # Start polling for the update types we handle
+            application.run_polling(
+                allowed_updates=ALLOWED_UPDATES,
+                drop_pending_updates=True  # Ignore updates that arrived while bot was offline
+            )
         
     except Exception as e:
-        logger.critical(f"Fatal error starting bot: {e}")
+        logger.critical("Fatal error starting bot: %s", e, exc_info=True)
         raise
 
 
@@ -5,77 +5,88 @@ This module provides type-safe callback data creation and parsing,
 eliminating string manipulation errors and providing clear structure.
 """
 
+import re
 from dataclasses import dataclass
 from typing import Optional, Union
-from enum import Enum
 
-from src.constants import CallbackAction, Difficulty
+from src.constants import CallbackAction
 
 
 # Separator used in callback data (Telegram limit is 64 bytes)
 CALLBACK_SEPARATOR = ":"
 
+# Answer actions as module globals, read on every encode/decode
+_ANSWER_CORRECT = CallbackAction.ANSWER_CORRECT
+_ANSWER_INCORRECT = CallbackAction.ANSWER_INCORRECT
 
-@dataclass(frozen=True)
+# Patterns are compiled once at import; pattern() hands out these objects
+# and decode() uses their groups, so a match is also a complete parse
+_ANSWER_RE = re.compile(r"^answer:(correct|incorrect)$")
+_DIFFICULTY_RE = re.compile(r"^difficulty:(easy|normal|hard):(\d+):([01])$")
+_NAVIGATION_RE = re.compile(r"^next:(word|stop)$")
+_START_LEARNING_RE = re.compile(r"^start:(now|later)$")
+_EDIT_FIELD_RE = re.compile(r"^edit:(word|definition|example|translation|cancel)$")
+_SETTINGS_RE = re.compile(r"^settings:(limit|reminder|time|back)$")
+_CONFIRM_RE = re.compile(r"^confirm:(yes|no)$")
+
+
+@dataclass(frozen=True, slots=True)
 class AnswerCallback:
     """Callback data for answer buttons (I Know / I Don't Know)."""
     is_correct: bool
     
     def encode(self) -> str:
         """Encode to callback data string."""
-        action = CallbackAction.ANSWER_CORRECT if self.is_correct else CallbackAction.ANSWER_INCORRECT
-        return action.value
+        return _ANSWER_CORRECT if self.is_correct else _ANSWER_INCORRECT
     
     @classmethod
     def decode(cls, data: str) -> Optional["AnswerCallback"]:
         """Decode from callback data string."""
-        if data == CallbackAction.ANSWER_CORRECT.value:
+        if data == _ANSWER_CORRECT:
             return cls(is_correct=True)
-        elif data == CallbackAction.ANSWER_INCORRECT.value:
+        elif data == _ANSWER_INCORRECT:
             return cls(is_correct=False)
         return None
     
     @staticmethod
-    def pattern() -> str:
-        """Regex pattern for CallbackQueryHandler."""
-        return r"^answer:(correct|incorrect)$"
+    def pattern() -> "re.Pattern[str]":
+        """Compiled regex pattern for CallbackQueryHandler."""
+        return _ANSWER_RE
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DifficultyCallback:
     """Callback data for difficulty rating buttons."""
-    difficulty: Difficulty
+    difficulty: str  # One of Difficulty.ALL_VALUES
     word_id: int
     is_correct: bool
     
     def encode(self) -> str:
         """Encode to callback data string."""
         correct_flag = "1" if self.is_correct else "0"
-        return f"difficulty:{self.difficulty.value}:{self.word_id}:{correct_flag}"
+        return f"difficulty:{self.difficulty}:{self.word_id}:{correct_flag}"
     
     @classmethod
     def decode(cls, data: str) -> Optional["DifficultyCallback"]:
         """Decode from callback data string."""
-        try:
-            parts = data.split(CALLBACK_SEPARATOR)
-            if len(parts) != 4 or parts[0] != "difficulty":
-                return None
-            
-            difficulty = Difficulty(parts[1])
-            word_id = int(parts[2])
-            is_correct = parts[3] == "1"
-            
-            return cls(difficulty=difficulty, word_id=word_id, is_correct=is_correct)
-        except (ValueError, IndexError):
+        match = _DIFFICULTY_RE.match(data)
+        if not match:
             return None
+        
+        difficulty, word_id, correct_flag = match.groups()
+        return cls(
+            difficulty=difficulty,
+            word_id=int(word_id),
+            is_correct=correct_flag == "1",
+        )
     
     @staticmethod
-    def pattern() -> str:
-        """Regex pattern for CallbackQueryHandler."""
-        return r"^difficulty:(easy|normal|hard):\d+:[01]$"
+    def pattern() -> "re.Pattern[str]":
+        """Compiled regex pattern for CallbackQueryHandler."""
+        return _DIFFICULTY_RE
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NavigationCallback:
     """Callback data for navigation buttons (Next Word / Stop Learning)."""
     action: str  # "word" or "stop"
@@ -87,18 +98,15 @@ class NavigationCallback:
     @classmethod
     def decode(cls, data: str) -> Optional["NavigationCallback"]:
         """Decode from callback data string."""
-        try:
-            parts = data.split(CALLBACK_SEPARATOR)
-            if len(parts) != 2 or parts[0] != "next":
-                return None
-            return cls(action=parts[1])
-        except (ValueError, IndexError):
+        match = _NAVIGATION_RE.match(data)
+        if not match:
             return None
+        return cls(action=match.group(1))
     
     @staticmethod
-    def pattern() -> str:
-        """Regex pattern for CallbackQueryHandler."""
-        return r"^next:(word|stop)$"
+    def pattern() -> "re.Pattern[str]":
+        """Compiled regex pattern for CallbackQueryHandler."""
+        return _NAVIGATION_RE
     
     @property
     def is_next_word(self) -> bool:
@@ -109,7 +117,7 @@ class NavigationCallback:
         return self.action == "stop"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StartLearningCallback:
     """Callback data for start learning buttons."""
     action: str  # "now" or "later"
@@ -121,25 +129,22 @@ class StartLearningCallback:
     @classmethod
     def decode(cls, data: str) -> Optional["StartLearningCallback"]:
         """Decode from callback data string."""
-        try:
-            parts = data.split(CALLBACK_SEPARATOR)
-            if len(parts) != 2 or parts[0] != "start":
-                return None
-            return cls(action=parts[1])
-        except (ValueError, IndexError):
+        match = _START_LEARNING_RE.match(data)
+        if not match:
             return None
+        return cls(action=match.group(1))
     
     @staticmethod
-    def pattern() -> str:
-        """Regex pattern for CallbackQueryHandler."""
-        return r"^start:(now|later)$"
+    def pattern() -> "re.Pattern[str]":
+        """Compiled regex pattern for CallbackQueryHandler."""
+        return _START_LEARNING_RE
     
     @property
     def is_now(self) -> bool:
         return self.action == "now"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EditFieldCallback:
     """Callback data for edit field selection buttons."""
     field: str  # "word", "definition", "example", "translation", or "cancel"
@@ -151,25 +156,22 @@ class EditFieldCallback:
     @classmethod
     def decode(cls, data: str) -> Optional["EditFieldCallback"]:
         """Decode from callback data string."""
-        try:
-            parts = data.split(CALLBACK_SEPARATOR)
-            if len(parts) != 2 or parts[0] != "edit":
-                return None
-            return cls(field=parts[1])
-        except (ValueError, IndexError):
+        match = _EDIT_FIELD_RE.match(data)
+        if not match:
             return None
+        return cls(field=match.group(1))
     
     @staticmethod
-    def pattern() -> str:
-        """Regex pattern for CallbackQueryHandler."""
-        return r"^edit:(word|definition|example|translation|cancel)$"
+    def pattern() -> "re.Pattern[str]":
+        """Compiled regex pattern for CallbackQueryHandler."""
+        return _EDIT_FIELD_RE
     
     @property
     def is_cancel(self) -> bool:
         return self.field == "cancel"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SettingsCallback:
     """Callback data for settings menu buttons."""
     action: str  # "limit", "reminder", "time", or "back"
@@ -181,18 +183,15 @@ class SettingsCallback:
     @classmethod
     def decode(cls, data: str) -> Optional["SettingsCallback"]:
         """Decode from callback data string."""
-        try:
-            parts = data.split(CALLBACK_SEPARATOR)
-            if len(parts) != 2 or parts[0] != "settings":
-                return None
-            return cls(action=parts[1])
-        except (ValueError, IndexError):
+        match = _SETTINGS_RE.match(data)
+        if not match:
             return None
+        return cls(action=match.group(1))
     
     @staticmethod
-    def pattern() -> str:
-        """Regex pattern for CallbackQueryHandler."""
-        return r"^settings:(limit|reminder|time|back)$"
+    def pattern() -> "re.Pattern[str]":
+        """Compiled regex pattern for CallbackQueryHandler."""
+        return _SETTINGS_RE
     
     @property
     def is_back(self) -> bool:
@@ -211,7 +210,7 @@ class SettingsCallback:
         return self.action == "time"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfirmCallback:
     """Callback data for confirmation buttons."""
     confirmed: bool
@@ -223,18 +222,15 @@ class ConfirmCallback:
     @classmethod
     def decode(cls, data: str) -> Optional["ConfirmCallback"]:
         """Decode from callback data string."""
-        try:
-            parts = data.split(CALLBACK_SEPARATOR)
-            if len(parts) != 2 or parts[0] != "confirm":
-                return None
-            return cls(confirmed=parts[1] == "yes")
-        except (ValueError, IndexError):
+        match = _CONFIRM_RE.match(data)
+        if not match:
             return None
+        return cls(confirmed=match.group(1) == "yes")
     
     @staticmethod
-    def pattern() -> str:
-        """Regex pattern for CallbackQueryHandler."""
-        return r"^confirm:(yes|no)$"
+    def pattern() -> "re.Pattern[str]":
+        """Compiled regex pattern for CallbackQueryHandler."""
+        return _CONFIRM_RE
 
 
 # Type alias for all callback types
@@ -249,10 +245,40 @@ CallbackData = Union[
 ]
 
 
+# Every callback format in one pattern. The last group to match names the
+# callback type (for difficulty that is "correct", its final field).
+_CALLBACK_RE = re.compile(
+    r"^(?:answer:(?P<answer>correct|incorrect)"
+    r"|difficulty:(?P<difficulty>easy|normal|hard):(?P<word_id>\d+):(?P<correct>[01])"
+    r"|next:(?P<next>word|stop)"
+    r"|start:(?P<start>now|later)"
+    r"|edit:(?P<edit>word|definition|example|translation|cancel)"
+    r"|settings:(?P<settings>limit|reminder|time|back)"
+    r"|confirm:(?P<confirm>yes|no))$"
+)
+
+_CALLBACK_BUILDERS = {
+    "answer": lambda m: AnswerCallback(is_correct=m["answer"] == "correct"),
+    "correct": lambda m: DifficultyCallback(
+        difficulty=m["difficulty"],
+        word_id=int(m["word_id"]),
+        is_correct=m["correct"] == "1",
+    ),
+    "next": lambda m: NavigationCallback(action=m["next"]),
+    "start": lambda m: StartLearningCallback(action=m["start"]),
+    "edit": lambda m: EditFieldCallback(field=m["edit"]),
+    "settings": lambda m: SettingsCallback(action=m["settings"]),
+    "confirm": lambda m: ConfirmCallback(confirmed=m["confirm"] == "yes"),
+}
+
+
 def parse_callback_data(data: str) -> Optional[CallbackData]:
     """
     Parse callback data string into appropriate callback object.
     
+    A single match against the combined pattern both validates the data
+    and selects the callback type.
+    
     Args:
         data: Raw callback data string from Telegram
         
@@ -262,20 +288,8 @@ def parse_callback_data(data: str) -> Optional[CallbackData]:
     if not data:
         return None
     
-    prefix = data.split(CALLBACK_SEPARATOR)[0] if CALLBACK_SEPARATOR in data else data
-    
-    parsers = {
-        "answer": AnswerCallback.decode,
-        "difficulty": DifficultyCallback.decode,
-        "next": NavigationCallback.decode,
-        "start": StartLearningCallback.decode,
-        "edit": EditFieldCallback.decode,
-        "settings": SettingsCallback.decode,
-        "confirm": ConfirmCallback.decode,
-    }
-    
-    parser = parsers.get(prefix)
-    if parser:
-        return parser(data)
+    match = _CALLBACK_RE.match(data)
+    if not match:
+        return None
     
-    return None
+    return _CALLBACK_BUILDERS[match.lastgroup](match)
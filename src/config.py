@@ -2,42 +2,92 @@
 
 import os
 from pathlib import Path
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
+from types import MappingProxyType
 
 # Base directory
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+def _load_env() -> None:
+    """
+    Load environment variables from the project's .env file.
+    
+    The file is read from BASE_DIR directly instead of searching parent
+    directories, and python-dotenv is only imported when the file exists.
+    Set SKIP_DOTENV to rely on the process environment alone (e.g. tests
+    or containers that inject variables).
+    """
+    env_file = BASE_DIR / ".env"
+    if os.getenv("SKIP_DOTENV") or not env_file.is_file():
+        return
+    
+    from dotenv import load_dotenv
+    load_dotenv(env_file)
+
+# Load environment variables before reading any setting below
+_load_env()
+
 # Telegram Bot Configuration
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 
+# Webhook Configuration (polling is used when WEBHOOK_URL is not set)
+WEBHOOK_URL = os.getenv("WEBHOOK_URL")
+WEBHOOK_LISTEN = os.getenv("WEBHOOK_LISTEN", "0.0.0.0")
+WEBHOOK_PORT = int(os.getenv("PORT", "8443"))
+# Optional secret Telegram echoes in a header; other requests are rejected
+WEBHOOK_SECRET_TOKEN = os.getenv("WEBHOOK_SECRET_TOKEN") or None
+
 # Database Configuration
 DATABASE_URL = os.getenv("DATABASE_URL", "postgresql://localhost/english_bot")
 
 # Application Settings
-ADMIN_USER_IDS = [int(uid) for uid in os.getenv("ADMIN_USER_IDS", "").split(",") if uid]
+# Comma-separated Telegram IDs; a set so membership checks are O(1)
+ADMIN_USER_IDS: frozenset[int] = frozenset(
+    int(uid) for uid in os.getenv("ADMIN_USER_IDS", "").split(",") if uid.strip()
+)
 TIMEZONE = os.getenv("TIMEZONE", "UTC")
 
+# Maximum number of updates handled at the same time. Handlers mostly wait
+# on Telegram and the database; the DB pool below is sized to match.
+CONCURRENT_UPDATES = int(os.getenv("CONCURRENT_UPDATES", "32"))
+
+# Database connection pool. Connections kept open between requests, plus
+# enough overflow that every concurrently running handler can get one
+# instead of waiting on the pool.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = max(CONCURRENT_UPDATES - DB_POOL_SIZE, 0)
+# Seconds a handler waits for a free connection before failing (SQLAlchemy's
+# default of 30 would leave the user without any answer for that long)
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "10"))
+
+# Set when DATABASE_URL points at PgBouncer (transaction pooling); PgBouncer
+# then does the pooling and the app opens a connection per session
+DB_BEHIND_PGBOUNCER = os.getenv("PGBOUNCER", "").lower() in ("1", "true", "yes")
+
 # Leitner System Configuration
-LEITNER_BOXES = {
-    1: 1,      # Review after 1 day
-    2: 2,      # Review after 2 days
-    3: 4,      # Review after 4 days
-    4: 7,      # Review after 7 days
-    5: 14,     # Review after 14 days
-    6: 30,     # Review after 30 days
-    7: 60,     # Review after 60 days (mastered)
-}
+# Review interval in days, indexed by box number (index 0 is unused)
+LEITNER_INTERVALS: tuple[int, ...] = (
+    0,
+    1,      # Box 1: review after 1 day
+    2,      # Box 2: review after 2 days
+    4,      # Box 3: review after 4 days
+    7,      # Box 4: review after 7 days
+    14,     # Box 5: review after 14 days
+    30,     # Box 6: review after 30 days
+    60,     # Box 7: review after 60 days (mastered)
+)
+
+# Read-only box -> interval mapping, kept for code that looks boxes up by key
+LEITNER_BOXES = MappingProxyType({
+    box: days for box, days in enumerate(LEITNER_INTERVALS) if box
+})
 
 # Daily reminder time (hour, minute)
 DAILY_REMINDER_TIME = (9, 0)  # 9:00 AM
 
 # Excel file configuration
-EXCEL_COLUMNS = {
+EXCEL_COLUMNS = MappingProxyType({
     "word": "word",
     "definition": "definition",
     "example": "example",
     "translation": "translation",
-}
+})
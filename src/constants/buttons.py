@@ -2,14 +2,19 @@
 Button text constants for Telegram keyboards.
 """
 
-from enum import Enum
+from typing import Final
 
 
-class Difficulty(str, Enum):
-    """Difficulty levels for word review."""
-    EASY = "easy"
-    NORMAL = "normal"
-    HARD = "hard"
+class Difficulty:
+    """
+    Difficulty levels for word review.
+    Plain string constants, used directly in callback data.
+    """
+    EASY: Final[str] = "easy"
+    NORMAL: Final[str] = "normal"
+    HARD: Final[str] = "hard"
+    
+    ALL_VALUES: Final[frozenset[str]] = frozenset({EASY, NORMAL, HARD})
 
 
 class ButtonText:
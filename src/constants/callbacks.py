@@ -2,63 +2,75 @@
 Callback data patterns for inline buttons.
 """
 
-from enum import Enum, auto
+from typing import Final
 
 
-class CallbackPrefix(str, Enum):
+class CallbackPrefix:
     """
     Callback data prefixes for inline buttons.
     Using consistent prefixes makes routing and parsing easier.
+    Plain string constants, so no Enum lookup runs on the hot path.
     """
     # Answer buttons
-    ANSWER = "answer"
+    ANSWER: Final[str] = "answer"
     
     # Difficulty buttons
-    DIFFICULTY = "difficulty"
+    DIFFICULTY: Final[str] = "difficulty"
     
     # Learning flow
-    NEXT_WORD = "next_word"
-    STOP_LEARNING = "stop_learning"
-    START_LEARNING = "start_learning"
+    NEXT_WORD: Final[str] = "next_word"
+    STOP_LEARNING: Final[str] = "stop_learning"
+    START_LEARNING: Final[str] = "start_learning"
     
     # Edit word
-    EDIT_FIELD = "edit_field"
-    EDIT_CANCEL = "edit_cancel"
+    EDIT_FIELD: Final[str] = "edit_field"
+    EDIT_CANCEL: Final[str] = "edit_cancel"
     
     # Settings
-    SETTINGS = "settings"
+    SETTINGS: Final[str] = "settings"
     
     # Confirmation
-    CONFIRM = "confirm"
+    CONFIRM: Final[str] = "confirm"
+    
+    # Every value above, for membership checks
+    ALL_VALUES: Final[frozenset[str]] = frozenset(
+        value for name, value in list(vars().items()) if not name.startswith("_")
+    )
 
 
-class CallbackAction(str, Enum):
+class CallbackAction:
     """
     Specific callback actions for buttons.
+    Plain string constants, usable directly as callback data.
     """
     # Answer actions
-    ANSWER_CORRECT = "answer:correct"
-    ANSWER_INCORRECT = "answer:incorrect"
+    ANSWER_CORRECT: Final[str] = "answer:correct"
+    ANSWER_INCORRECT: Final[str] = "answer:incorrect"
     
     # Next/Stop actions
-    NEXT_WORD = "next:word"
-    STOP_LEARNING = "next:stop"
-    START_LEARNING_NOW = "start:now"
-    START_LEARNING_LATER = "start:later"
+    NEXT_WORD: Final[str] = "next:word"
+    STOP_LEARNING: Final[str] = "next:stop"
+    START_LEARNING_NOW: Final[str] = "start:now"
+    START_LEARNING_LATER: Final[str] = "start:later"
     
     # Edit field actions
-    EDIT_WORD = "edit:word"
-    EDIT_DEFINITION = "edit:definition"
-    EDIT_EXAMPLE = "edit:example"
-    EDIT_TRANSLATION = "edit:translation"
-    EDIT_CANCEL = "edit:cancel"
+    EDIT_WORD: Final[str] = "edit:word"
+    EDIT_DEFINITION: Final[str] = "edit:definition"
+    EDIT_EXAMPLE: Final[str] = "edit:example"
+    EDIT_TRANSLATION: Final[str] = "edit:translation"
+    EDIT_CANCEL: Final[str] = "edit:cancel"
     
     # Settings actions
-    SETTINGS_LIMIT = "settings:limit"
-    SETTINGS_REMINDER = "settings:reminder"
-    SETTINGS_TIME = "settings:time"
-    SETTINGS_BACK = "settings:back"
+    SETTINGS_LIMIT: Final[str] = "settings:limit"
+    SETTINGS_REMINDER: Final[str] = "settings:reminder"
+    SETTINGS_TIME: Final[str] = "settings:time"
+    SETTINGS_BACK: Final[str] = "settings:back"
     
     # Confirmation actions
-    CONFIRM_YES = "confirm:yes"
-    CONFIRM_NO = "confirm:no"
+    CONFIRM_YES: Final[str] = "confirm:yes"
+    CONFIRM_NO: Final[str] = "confirm:no"
+    
+    # Every value above, for membership checks
+    ALL_VALUES: Final[frozenset[str]] = frozenset(
+        value for name, value in list(vars().items()) if not name.startswith("_")
+    )
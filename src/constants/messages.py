@@ -2,10 +2,16 @@
 User-facing message templates for the English Learning Bot.
 """
 
+from html import escape
+
+
 class Messages:
     """
     Bot message templates.
     Centralized for consistency and easy modification.
+    Templates with values are f-string methods, so no str.format
+    parsing runs per message. Formatted templates are sent with
+    parse_mode="HTML"; user-entered values are escaped.
     """
     # Errors
     ERROR_GENERIC = "❌ An error occurred. Please try again later."
@@ -13,15 +19,10 @@ class Messages:
     ERROR_WORD_NOT_FOUND = "❌ Word not found."
     ERROR_SESSION_EXPIRED = "❌ Session expired. Please start again."
     ERROR_INVALID_NUMBER = "❌ Please enter a valid number."
-    ERROR_NUMBER_RANGE = "❌ Please enter a number between {min} and {max}."
     ERROR_INVALID_TIME = "❌ Invalid format. Please enter time in 24-hour format (HH:MM)."
     
     # Success
     SUCCESS_OPERATION_CANCELLED = "✅ Operation cancelled."
-    SUCCESS_WORD_LIMIT_SET = "✅ Great! You'll practice {limit} words per day.\n\nUse the menu below to get started!"
-    SUCCESS_WORDS_ADDED = "✅ Successfully added {count} words!"
-    SUCCESS_WORD_UPDATED = "✅ Updated **{word}**\n\n{field}: {value}"
-    SUCCESS_REMINDER_TIME_SET = "✅ Reminder time updated to **{time}**!"
     
     # Prompts
     PROMPT_USE_MENU = "I didn't understand that. Please use the menu buttons below."
@@ -38,7 +39,6 @@ class Messages:
         "Use /sample to get a sample Excel template."
     )
     PROMPT_EDIT_WORD = "✏️ Edit Word\n\nEnter the word you want to edit:"
-    PROMPT_EDIT_VALUE = "✏️ Enter new value for **{field}**:"
     PROMPT_REMINDER_TIME = "⏰ Enter new reminder time in HH:MM format (24-hour):"
     
     # Learning
@@ -46,14 +46,6 @@ class Messages:
         "🎉 Great job! You have no words to review today.\n"
         "Add more words or come back tomorrow!"
     )
-    SESSION_STARTING = (
-        "📚 Starting learning session!\n"
-        "📊 Review: {review_count} words\n"
-        "✨ New: {new_count} words\n"
-        "📈 Total: {total_count} words\n\n"
-        "Let's begin! 🚀"
-    )
-    
     @staticmethod
     def welcome_new_user(first_name: str) -> str:
         return (
@@ -69,3 +61,40 @@ class Messages:
             f"👋 Welcome back, {first_name}!\n\n"
             "Choose an option from the menu below:"
         )
+    
+    @staticmethod
+    def error_number_range(min_value: int, max_value: int) -> str:
+        return f"❌ Please enter a number between {min_value} and {max_value}."
+    
+    @staticmethod
+    def success_word_limit_set(limit: int) -> str:
+        return (
+            f"✅ Great! You'll practice {limit} words per day.\n\n"
+            "Use the menu below to get started!"
+        )
+    
+    @staticmethod
+    def success_words_added(count: int) -> str:
+        return f"✅ Successfully added {count} words!"
+    
+    @staticmethod
+    def success_word_updated(word: str, field: str, value: str) -> str:
+        return f"✅ Updated <b>{escape(word)}</b>\n\n{field}: {escape(value)}"
+    
+    @staticmethod
+    def success_reminder_time_set(time: str) -> str:
+        return f"✅ Reminder time updated to <b>{time}</b>!"
+    
+    @staticmethod
+    def prompt_edit_value(field: str) -> str:
+        return f"✏️ Enter new value for <b>{field}</b>:"
+    
+    @staticmethod
+    def session_starting(review_count: int, new_count: int, total_count: int) -> str:
+        return (
+            "📚 Starting learning session!\n"
+            f"📊 Review: {review_count} words\n"
+            f"✨ New: {new_count} words\n"
+            f"📈 Total: {total_count} words\n\n"
+            "Let's begin! 🚀"
+        )
@@ -2,42 +2,43 @@
 Conversation states and session keys for the English Learning Bot.
 """
 
-from enum import IntEnum, Enum, auto
+from typing import Final
 
 
-class ConversationState(IntEnum):
+class ConversationState:
     """
     Conversation states for ConversationHandler.
-    Using IntEnum ensures unique values and compatibility with python-telegram-bot.
+    Plain int constants: they key each handler's states dict, so the
+    per-update state lookup hashes and compares a plain int.
+    Values must stay unique.
     """
     # Initial setup
-    WAITING_WORD_LIMIT = auto()
+    WAITING_WORD_LIMIT: Final[int] = 1
     
     # Add words flow
-    WAITING_EXCEL_FILE = auto()
+    WAITING_EXCEL_FILE: Final[int] = 2
     
     # Edit word flow
-    WAITING_WORD_TO_EDIT = auto()
-    WAITING_EDIT_VALUE = auto()
+    WAITING_WORD_TO_EDIT: Final[int] = 3
+    WAITING_EDIT_VALUE: Final[int] = 4
     
     # Settings flow
-    SETTINGS_MENU = auto()
-    WAITING_REMINDER_TIME = auto()
+    SETTINGS_MENU: Final[int] = 5
+    WAITING_REMINDER_TIME: Final[int] = 6
 
 
-class SessionKey(str, Enum):
+class SessionKey:
     """
     Keys for user_data/context.user_data storage.
-    Using str Enum allows direct use as dictionary keys.
+    Plain str constants: they are used directly as dictionary keys, so
+    reading or writing session data needs no enum-to-value conversion.
     """
-    # Learning session
-    CURRENT_WORD = "current_word"
-    STUDY_SESSION_ID = "study_session_id"
-    WORDS_TO_REVIEW = "words_to_review"
-    NEW_WORDS = "new_words"
-    WORD_INDEX = "word_index"
-    LAST_ANSWER_CORRECT = "last_answer_correct"
+    # Learning session (a handlers.learning.LearningState)
+    LEARNING: Final[str] = "learning"
     
     # Edit session
-    EDIT_WORD_ID = "edit_word_id"
-    EDIT_FIELD = "edit_field"
+    EDIT_WORD_ID: Final[str] = "edit_word_id"
+    EDIT_FIELD: Final[str] = "edit_field"
+    
+    # Cached user preferences (see handlers.base.get_user_settings)
+    USER_SETTINGS: Final[str] = "user_settings"
@@ -10,7 +10,16 @@ from src.conversations.add_words_conversation import create_add_words_conversati
 from src.conversations.edit_word_conversation import create_edit_word_conversation
 from src.conversations.settings_conversation import create_settings_conversation
 
+# Factories in registration order; bot.py adds one handler per entry
+CONVERSATION_FACTORIES = (
+    create_start_conversation,
+    create_add_words_conversation,
+    create_edit_word_conversation,
+    create_settings_conversation,
+)
+
 __all__ = [
+    "CONVERSATION_FACTORIES",
     "create_start_conversation",
     "create_add_words_conversation",
     "create_edit_word_conversation",
@@ -2,13 +2,16 @@
 Add words conversation handler for Excel file upload.
 """
 
-from telegram.ext import MessageHandler, CommandHandler, ConversationHandler, filters
+import logging
 
-from src.constants import ConversationState, ButtonText
-from src.handlers import add_words_prompt, handle_excel_file, cancel_command
-from src.logger import setup_logger
+from telegram.ext import MessageHandler, ConversationHandler
 
-logger = setup_logger(__name__)
+from src.constants import ConversationState
+from src.handlers import add_words_prompt, handle_excel_file
+from src.conversations.common import CANCEL_FALLBACK
+from src.filters import ADD_WORDS_BUTTON, EXCEL_DOCUMENT
+
+logger = logging.getLogger(__name__)
 
 
 def create_add_words_conversation() -> ConversationHandler:
@@ -22,21 +25,19 @@ def create_add_words_conversation() -> ConversationHandler:
     return ConversationHandler(
         entry_points=[
             MessageHandler(
-                filters.Regex(f"^{ButtonText.ADD_WORDS}$"),
+                ADD_WORDS_BUTTON,
                 add_words_prompt
             ),
         ],
         states={
             ConversationState.WAITING_EXCEL_FILE: [
-                MessageHandler(
-                    filters.Document.FileExtension("xlsx"),
-                    handle_excel_file
-                )
+                # Runs inline like every other handler: the update processor
+                # serializes it with the user's other updates while other
+                # users keep being served during a long import
+                MessageHandler(EXCEL_DOCUMENT, handle_excel_file)
             ],
         },
-        fallbacks=[
-            CommandHandler("cancel", cancel_command)
-        ],
+        fallbacks=[CANCEL_FALLBACK],
         name="add_words_conversation",
         persistent=False,
     )
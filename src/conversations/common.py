@@ -0,0 +1,11 @@
+"""
+Handlers shared by several conversation handlers.
+"""
+
+from telegram.ext import CommandHandler
+
+from src.handlers import cancel_command
+
+# /cancel ends any active conversation. Handlers hold no per-conversation
+# state, so one instance serves as the fallback for every conversation.
+CANCEL_FALLBACK = CommandHandler("cancel", cancel_command)
@@ -2,13 +2,16 @@
 Edit word conversation handler for modifying existing words.
 """
 
-from telegram.ext import MessageHandler, CommandHandler, ConversationHandler, filters
+import logging
 
-from src.constants import ConversationState, ButtonText
-from src.handlers import edit_word_prompt, select_word_to_edit, cancel_command
-from src.logger import setup_logger
+from telegram.ext import MessageHandler, ConversationHandler
 
-logger = setup_logger(__name__)
+from src.constants import ConversationState
+from src.handlers import edit_word_prompt, select_word_to_edit
+from src.conversations.common import CANCEL_FALLBACK
+from src.filters import EDIT_WORD_BUTTON, TEXT_NOT_COMMAND
+
+logger = logging.getLogger(__name__)
 
 
 def create_edit_word_conversation() -> ConversationHandler:
@@ -23,18 +26,16 @@ def create_edit_word_conversation() -> ConversationHandler:
     return ConversationHandler(
         entry_points=[
             MessageHandler(
-                filters.Regex(f"^{ButtonText.EDIT_WORD}$"),
+                EDIT_WORD_BUTTON,
                 edit_word_prompt
             ),
         ],
         states={
             ConversationState.WAITING_WORD_TO_EDIT: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, select_word_to_edit)
+                MessageHandler(TEXT_NOT_COMMAND, select_word_to_edit)
             ],
         },
-        fallbacks=[
-            CommandHandler("cancel", cancel_command)
-        ],
+        fallbacks=[CANCEL_FALLBACK],
         name="edit_word_conversation",
         persistent=False,
     )
@@ -2,14 +2,22 @@
 Settings conversation handler for user preferences.
 """
 
-from telegram.ext import MessageHandler, CommandHandler, ConversationHandler, CallbackQueryHandler, filters
+import logging
+import re
 
-from src.constants import ConversationState, ButtonText
-from src.handlers import show_settings, handle_settings_buttons, set_word_limit, set_reminder_time, cancel_command
+from telegram.ext import MessageHandler, ConversationHandler, CallbackQueryHandler
+
+from src.constants import ConversationState, CallbackAction
+from src.handlers import show_settings, handle_settings_buttons, set_word_limit, set_reminder_time
 from src.callback_data import SettingsCallback
-from src.logger import setup_logger
+from src.conversations.common import CANCEL_FALLBACK
+from src.filters import SETTINGS_BUTTON, TEXT_NOT_COMMAND
+
+logger = logging.getLogger(__name__)
 
-logger = setup_logger(__name__)
+# Callback patterns resolved once at import and shared by every handler
+_SETTINGS_CB_PATTERN = SettingsCallback.pattern()
+_SETTINGS_BACK_PATTERN = re.compile(f"^{re.escape(CallbackAction.SETTINGS_BACK)}$")
 
 
 def create_settings_conversation() -> ConversationHandler:
@@ -25,7 +33,7 @@ def create_settings_conversation() -> ConversationHandler:
     return ConversationHandler(
         entry_points=[
             MessageHandler(
-                filters.Regex(f"^{ButtonText.SETTINGS}$"),
+                SETTINGS_BUTTON,
                 show_settings
             )
         ],
@@ -33,21 +41,21 @@ def create_settings_conversation() -> ConversationHandler:
             ConversationState.SETTINGS_MENU: [
                 CallbackQueryHandler(
                     handle_settings_buttons,
-                    pattern=SettingsCallback.pattern()
+                    pattern=_SETTINGS_CB_PATTERN
                 )
             ],
             ConversationState.WAITING_WORD_LIMIT: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, set_word_limit)
+                MessageHandler(TEXT_NOT_COMMAND, set_word_limit)
             ],
             ConversationState.WAITING_REMINDER_TIME: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, set_reminder_time)
+                MessageHandler(TEXT_NOT_COMMAND, set_reminder_time)
             ],
         },
         fallbacks=[
-            CommandHandler("cancel", cancel_command),
+            CANCEL_FALLBACK,
             CallbackQueryHandler(
                 handle_settings_buttons,
-                pattern=r"^settings:back$"
+                pattern=_SETTINGS_BACK_PATTERN
             )
         ],
         name="settings_conversation",
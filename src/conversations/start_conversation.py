@@ -2,13 +2,16 @@
 Start conversation handler for user registration and setup.
 """
 
-from telegram.ext import CommandHandler, MessageHandler, ConversationHandler, filters
+import logging
+
+from telegram.ext import CommandHandler, MessageHandler, ConversationHandler
 
 from src.constants import ConversationState
-from src.handlers import start_command, set_word_limit, cancel_command
-from src.logger import setup_logger
+from src.handlers import start_command, set_word_limit
+from src.conversations.common import CANCEL_FALLBACK
+from src.filters import TEXT_NOT_COMMAND
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
 
 
 def create_start_conversation() -> ConversationHandler:
@@ -25,12 +28,10 @@ def create_start_conversation() -> ConversationHandler:
         ],
         states={
             ConversationState.WAITING_WORD_LIMIT: [
-                MessageHandler(filters.TEXT & ~filters.COMMAND, set_word_limit)
+                MessageHandler(TEXT_NOT_COMMAND, set_word_limit)
             ],
         },
-        fallbacks=[
-            CommandHandler("cancel", cancel_command)
-        ],
+        fallbacks=[CANCEL_FALLBACK],
         name="start_conversation",
         persistent=False,
     )
@@ -1,20 +1,30 @@
 """Database utilities and session management"""
 
+import logging
+import uuid
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional, Union
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
+    AsyncConnection,
     AsyncEngine,
     create_async_engine,
     async_sessionmaker,
 )
+from sqlalchemy.pool import NullPool
 
 from src.models import Base
-from src.config import DATABASE_URL
-from src.logger import setup_logger
+from src.config import (
+    DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT,
+    DB_BEHIND_PGBOUNCER,
+)
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
 
 # Convert postgres:// to postgresql:// for SQLAlchemy 2.0 and handle asyncpg
 if DATABASE_URL and DATABASE_URL.startswith("postgres://"):
@@ -24,14 +34,44 @@ elif DATABASE_URL and DATABASE_URL.startswith("postgresql://"):
 else:
     database_url = DATABASE_URL
 
-# Create async engine
-engine: AsyncEngine = create_async_engine(
-    database_url,
-    echo=False,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
+if DB_BEHIND_PGBOUNCER:
+    # PgBouncer pools server connections, so a second pool here would only
+    # pin them. In transaction mode consecutive statements may run on
+    # different server connections, so asyncpg must not cache prepared
+    # statements and needs unique statement names.
+    _engine_options = {
+        "poolclass": NullPool,
+        "connect_args": {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+        },
+    }
+else:
+    # Async engines use AsyncAdaptedQueuePool by default. No pre-ping: it
+    # costs a round trip on every checkout. Dead connections are instead
+    # found by TCP keepalives and short recycling; when one still fails,
+    # SQLAlchemy invalidates the pool so the next checkout reconnects.
+    # Handler queries are short, so statements are capped server-side at
+    # 10s; long jobs lift the cap for their transaction with
+    # lift_statement_timeout().
+    _engine_options = {
+        "pool_pre_ping": False,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        # Replace connections before server or firewall idle timeouts drop them
+        "pool_recycle": 300,
+        "connect_args": {
+            "server_settings": {
+                "tcp_keepalives_idle": "60",
+                "statement_timeout": "10000",
+            },
+        },
+    }
+
+# Create async engine; the single pool shared by every handler via get_session()
+engine: AsyncEngine = create_async_engine(database_url, echo=False, **_engine_options)
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
@@ -40,14 +80,77 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
-async def init_db():
-    """Initialize database tables"""
+# Lifts the statement timeout until the current transaction ends
+_NO_STATEMENT_TIMEOUT = text("SET LOCAL statement_timeout = 0")
+
+async def lift_statement_timeout(executor: Union[AsyncSession, AsyncConnection]) -> None:
+    """
+    Remove the statement timeout for the rest of the current transaction.
+    
+    For work that legitimately runs long, such as large Excel imports and
+    schema setup; call again after each commit. PostgreSQL only.
+    """
+    await executor.execute(_NO_STATEMENT_TIMEOUT)
+
+def create_unpooled_engine() -> AsyncEngine:
+    """
+    Create an engine without a connection pool.
+    
+    Intended for one-shot scripts (e.g. setup_db.py) that open a single
+    connection and exit, so no pool needs to be warmed up or drained.
+    """
+    return create_async_engine(database_url, echo=False, poolclass=NullPool)
+
+# One round trip telling whether every given table already exists
+_ALL_TABLES_EXIST = text(
+    "SELECT bool_and(to_regclass(name) IS NOT NULL) "
+    "FROM unnest(CAST(:names AS text[])) AS name"
+)
+
+# Case-insensitive word uniqueness; Excel imports use it for ON CONFLICT.
+# Schemas created before it existed get it from Alembic revision a3c9e1f47b20.
+_WORD_LOWER_INDEX_EXISTS = text("SELECT to_regclass('uq_words_word_lower') IS NOT NULL")
+
+async def _check_word_lower_index(conn) -> None:
+    """
+    Refuse to start on an existing schema without the lower(word) index.
+    
+    Building it may merge words that differ only by case, so that is left
+    to the migration rather than done implicitly at startup.
+    """
+    if not await conn.scalar(_WORD_LOWER_INDEX_EXISTS):
+        raise RuntimeError(
+            "Index uq_words_word_lower is missing; run 'alembic upgrade head' "
+            "to create it (words differing only by case are merged)"
+        )
+
+async def init_db(db_engine: Optional[AsyncEngine] = None):
+    """
+    Initialize database tables
+    
+    On PostgreSQL a single query checks whether the schema is already in
+    place, so restarts skip create_all's per-table existence checks.
+    
+    Args:
+        db_engine: Engine to use; defaults to the application's pooled engine
+    """
     try:
-        async with engine.begin() as conn:
+        async with (db_engine or engine).begin() as conn:
+            if conn.dialect.name == "postgresql":
+                # Index builds and create_all may outlast the handler timeout
+                await lift_statement_timeout(conn)
+                tables_exist = await conn.scalar(
+                    _ALL_TABLES_EXIST,
+                    {"names": list(Base.metadata.tables)},
+                )
+                if tables_exist:
+                    logger.info("Database tables already exist")
+                    await _check_word_lower_index(conn)
+                    return
             await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables initialized successfully")
     except Exception as e:
-        logger.error(f"Error initializing database: {e}")
+        logger.error("Error initializing database: %s", e)
         raise
 
 @asynccontextmanager
@@ -62,7 +165,7 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.commit()
         except Exception as e:
             await session.rollback()
-            logger.error(f"Database session error: {e}")
+            logger.error("Database session error: %s", e)
             raise
         finally:
             await session.close()
@@ -1,161 +1,298 @@
 """Excel file processing for word import"""
 
-from typing import List, Tuple, Optional
+import logging
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Set, Tuple, Optional, Union
 from pathlib import Path
-import openpyxl
-from openpyxl.styles import Font
-from sqlalchemy import select
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database import lift_statement_timeout
 from src.models import Word
 from src.config import EXCEL_COLUMNS
-from src.logger import setup_logger
 
-logger = setup_logger(__name__)
+# openpyxl is imported on first use: it is only needed for uploads and
+# /sample, so startup does not pay for loading it
+if TYPE_CHECKING:
+    from openpyxl import Workbook
 
-async def process_excel_file(
-    session: AsyncSession,
-    file_path: Path,
-    user_id: int
-) -> Tuple[int, List[str]]:
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT statement; 5 columns each stays well below the driver's bind limit
+_INSERT_BATCH_SIZE = 1000
+
+# Uploads with more new words than this are streamed with COPY (asyncpg only)
+_COPY_THRESHOLD = 5000
+
+# Staging table for COPY; dropped automatically when the import commits
+_CREATE_IMPORT_TABLE = text(
+    "CREATE TEMP TABLE words_import "
+    "(word text, definition text, example text, translation text) ON COMMIT DROP"
+)
+_IMPORT_COLUMNS = ["word", "definition", "example", "translation"]
+
+# Move staged rows into words; existing words are skipped by the unique index
+_INSERT_FROM_IMPORT = text(
+    "INSERT INTO words "
+    "(word, definition, example, translation, added_by, added_at, updated_at, is_active) "
+    "SELECT word, definition, example, translation, :added_by, :now, :now, true "
+    "FROM words_import "
+    "ON CONFLICT (lower(word)) DO NOTHING "
+    "RETURNING word"
+)
+
+# Parsed Excel row: (word, definition, example, translation)
+ExcelRow = Tuple[str, str, Optional[str], Optional[str]]
+
+# A workbook on disk or already in memory (e.g. a downloaded upload)
+ExcelSource = Union[Path, BinaryIO]
+
+def _open_workbook(source: ExcelSource) -> "Workbook":
     """
-    Process Excel file and add words to database.
+    Open an uploaded workbook for streaming reads.
     
-    Returns:
-        Tuple of (number of words added, list of duplicate words)
+    Read-only mode parses rows lazily instead of building every cell and
+    its styles in memory; data_only returns formula results, not formulas.
+    The caller must close() the workbook to release the file.
+    """
+    from openpyxl import load_workbook
+    
+    return load_workbook(source, read_only=True, data_only=True)
+
+def _read_headers(header_row: tuple) -> Dict[str, int]:
+    """
+    Map lowercase header names to their 0-based column index.
+    
+    Only text cells can name a column, so other values are skipped
+    without converting them to strings.
     """
-    logger.info(f"Processing excel file {file_path} for user {user_id}")
+    headers = {}
+    for idx, value in enumerate(header_row):
+        if isinstance(value, str):
+            name = value.strip().lower()
+            if name:
+                headers[name] = idx
+    return headers
+
+def _cell_text(row: tuple, idx: Optional[int]) -> Optional[str]:
+    """Stripped text of a row cell, or None if missing or empty."""
+    if idx is None or idx >= len(row) or not row[idx]:
+        return None
+    return str(row[idx]).strip()
+
+def _parse_xlsx(source: ExcelSource) -> List[ExcelRow]:
+    """
+    Read word rows from an Excel file.
+    
+    Blocking (openpyxl parses the workbook), so callers on the
+    event loop should run it in a worker thread.
+    
+    Raises:
+        ValueError: If the worksheet, the header row or a required column is missing
+    """
+    # Load Excel file
+    wb = _open_workbook(source)
     try:
-        # Load Excel file
-        wb = openpyxl.load_workbook(file_path)
         ws = wb.active
         
         # Check if worksheet exists
         if ws is None:
-            error_msg = "Excel file has no active worksheet"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
+            raise ValueError("Excel file has no active worksheet")
+        
+        sheet_rows = ws.iter_rows(values_only=True)
+        
+        # Check if file has at least header row
+        header_row = next(sheet_rows, None)
+        if header_row is None:
+            raise ValueError("Excel file is empty")
         
         # Get header row to map columns
-        headers = {}
-        for idx, cell in enumerate(ws[1], start=1):
-            if cell.value:
-                header_lower = str(cell.value).lower().strip()
-                headers[header_lower] = idx
+        headers = _read_headers(header_row)
         
         # Verify required columns exist
         required_columns = ["word", "definition"]
         for col in required_columns:
             if col not in headers:
-                error_msg = f"Required column '{col}' not found in Excel file"
-                logger.error(error_msg)
-                raise ValueError(error_msg)
+                raise ValueError(f"Missing required column: '{col}'")
         
-        added_count = 0
-        duplicates = []
+        word_col = headers["word"]
+        definition_col = headers["definition"]
+        example_col = headers.get("example")
+        translation_col = headers.get("translation")
+        
+        rows = []
         
-        # Process each row
-        for row_idx in range(2, ws.max_row + 1):  # Start from row 2 (skip header)
-            # Extract data
-            word_text = ws.cell(row_idx, headers["word"]).value
-            definition_text = ws.cell(row_idx, headers["definition"]).value
+        # Process each remaining row (the header was consumed above)
+        for row in sheet_rows:
+            word_text = _cell_text(row, word_col)
+            definition_text = _cell_text(row, definition_col)
             
             # Skip empty rows
             if not word_text or not definition_text:
                 continue
             
-            word_text = str(word_text).strip()
-            definition_text = str(definition_text).strip()
-            
-            # Get optional fields
-            example_text = None
-            if "example" in headers:
-                example_cell = ws.cell(row_idx, headers["example"]).value
-                if example_cell:
-                    example_text = str(example_cell).strip()
-            
-            translation_text = None
-            if "translation" in headers:
-                translation_cell = ws.cell(row_idx, headers["translation"]).value
-                if translation_cell:
-                    translation_text = str(translation_cell).strip()
-            
-            # Check if word already exists (case-insensitive)
-            stmt = select(Word).where(Word.word.ilike(word_text))
-            result = await session.execute(stmt)
-            existing_word = result.scalar_one_or_none()
-            
-            if existing_word:
-                duplicates.append(word_text)
-                continue
-            
-            # Add new word
-            new_word = Word(
-                word=word_text,
-                definition=definition_text,
-                example=example_text,
-                translation=translation_text,
-                added_by=user_id
-            )
-            session.add(new_word)
-            added_count += 1
-        
-        # Commit all changes
-        await session.commit()
-        
-        logger.info(f"Processed file. Added: {added_count}, Duplicates: {len(duplicates)}")
-        return added_count, duplicates
+            rows.append((
+                word_text,
+                definition_text,
+                _cell_text(row, example_col),
+                _cell_text(row, translation_col),
+            ))
         
+        return rows
+    finally:
+        wb.close()
+
+def read_excel_file(source: ExcelSource) -> Tuple[Optional[List[ExcelRow]], Optional[str]]:
+    """
+    Validate an Excel file and read its word rows in a single pass.
+    
+    Accepts a path or a binary file object such as an in-memory upload.
+    
+    The workbook is opened once; the rows are handed to
+    process_excel_file instead of parsing the file again. Blocking,
+    so run it in a worker thread from the event loop.
+    
+    Returns:
+        Tuple of (rows, None) if valid, or (None, error_message)
+    """
+    try:
+        return _parse_xlsx(source), None
+    except ValueError as e:
+        logger.error("Invalid Excel file: %s", e)
+        return None, str(e)
     except Exception as e:
-        logger.error(f"Error processing excel file: {e}")
-        raise
+        error_msg = f"Error reading Excel file: {str(e)}"
+        logger.error(error_msg)
+        return None, error_msg
+
+async def _insert_word_batches(session: AsyncSession, new_words: List[dict]) -> Set[str]:
+    """
+    Insert words with multi-row INSERT ... ON CONFLICT DO NOTHING statements.
+    
+    Each batch is committed on its own, so a large sheet never holds
+    one long transaction (and its locks) on the words table.
+    
+    Returns:
+        The words that were inserted
+    """
+    inserted = set()
+    for start in range(0, len(new_words), _INSERT_BATCH_SIZE):
+        batch = new_words[start:start + _INSERT_BATCH_SIZE]
+        # Each batch is its own transaction, so the timeout is lifted per batch
+        await lift_statement_timeout(session)
+        stmt = (
+            pg_insert(Word)
+            .values(batch)
+            .on_conflict_do_nothing(index_elements=[func.lower(Word.word)])
+            .returning(Word.word)
+        )
+        inserted.update(await session.scalars(stmt))
+        await session.commit()
+    return inserted
 
+async def _copy_words(session: AsyncSession, new_words: List[dict], user_id: int) -> Set[str]:
+    """
+    Insert words by streaming them with COPY into a staging table.
+    
+    COPY sends all rows in one binary stream instead of bound INSERT
+    parameters; a single INSERT ... SELECT then moves them into words.
+    Requires the asyncpg driver.
+    
+    Returns:
+        The words that were inserted
+    """
+    # Lifting the timeout through the session starts the transaction the
+    # raw COPY below runs in, so it and the staging table last until commit
+    await lift_statement_timeout(session)
+    await session.execute(_CREATE_IMPORT_TABLE)
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        "words_import",
+        records=[
+            (values["word"], values["definition"], values["example"], values["translation"])
+            for values in new_words
+        ],
+        columns=_IMPORT_COLUMNS,
+    )
+    
+    result = await session.scalars(
+        _INSERT_FROM_IMPORT, {"added_by": user_id, "now": datetime.utcnow()}
+    )
+    inserted = set(result)
+    await session.commit()
+    return inserted
 
-def validate_excel_structure(file_path: Path) -> Tuple[bool, Optional[str]]:
+async def process_excel_file(
+    session: AsyncSession,
+    rows: List[ExcelRow],
+    user_id: int
+) -> Tuple[int, List[str]]:
     """
-    Validate Excel file structure.
+    Add words read by read_excel_file to the database.
     
     Returns:
-        Tuple of (is_valid, error_message)
+        Tuple of (number of words added, list of duplicate words)
     """
+    logger.info("Processing %s excel rows for user %s", len(rows), user_id)
     try:
-        wb = openpyxl.load_workbook(file_path)
-        ws = wb.active
-        
-        # Check if worksheet exists
-        if ws is None:
-            return False, "Excel file has no active worksheet"
+        new_words = []
+        duplicates = []
+        seen = set()
         
-        # Check if file has at least header row
-        if ws.max_row < 1:
-            return False, "Excel file is empty"
+        for word_text, definition_text, example_text, translation_text in rows:
+            key = word_text.lower()
+            # Later rows repeating a word in the same file are duplicates
+            if key in seen:
+                duplicates.append(word_text)
+                continue
+            
+            seen.add(key)
+            new_words.append({
+                "word": word_text,
+                "definition": definition_text,
+                "example": example_text,
+                "translation": translation_text,
+                "added_by": user_id,
+            })
         
-        # Get headers
-        headers = []
-        for cell in ws[1]:
-            if cell.value:
-                headers.append(str(cell.value).lower().strip())
+        # Words already in the database are skipped by the unique index on
+        # lower(word); the insert reports which rows actually went in
+        connection = await session.connection()
+        if len(new_words) > _COPY_THRESHOLD and connection.dialect.driver == "asyncpg":
+            inserted = await _copy_words(session, new_words, user_id)
+        else:
+            inserted = await _insert_word_batches(session, new_words)
         
-        # Check required columns
-        if "word" not in headers:
-            return False, "Missing required column: 'word'"
-        if "definition" not in headers:
-            return False, "Missing required column: 'definition'"
+        duplicates.extend(
+            values["word"] for values in new_words if values["word"] not in inserted
+        )
+        added_count = len(inserted)
         
-        return True, None
+        logger.info("Processed file. Added: %s, Duplicates: %s", added_count, len(duplicates))
+        return added_count, duplicates
         
     except Exception as e:
-        error_msg = f"Error reading Excel file: {str(e)}"
-        logger.error(error_msg)
-        return False, error_msg
+        logger.error("Error processing excel file: %s", e)
+        raise
 
 
-def create_sample_excel(file_path: Path) -> None:
+def create_sample_excel(destination: ExcelSource) -> None:
     """
     Create a sample Excel template for word import.
+    
+    Args:
+        destination: Path or writable binary file object to save to
     """
+    from openpyxl import Workbook
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+    
     try:
-        wb = openpyxl.Workbook()
+        wb = Workbook()
         ws = wb.active
         if ws is None:
             ws = wb.create_sheet("Words")
@@ -179,23 +316,33 @@ def create_sample_excel(file_path: Path) -> None:
              "She gave an eloquent speech", "شیوا، گویا"],
         ]
         
-        for row_idx, row_data in enumerate(sample_data, start=2):
-            for col_idx, value in enumerate(row_data, start=1):
-                ws.cell(row_idx, col_idx).value = value
+        for row_data in sample_data:
+            ws.append(row_data)
         
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                if cell.value:
-                    max_length = max(max_length, len(str(cell.value)))
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        # Auto-adjust column widths from the values written above, in one
+        # pass over plain lists instead of walking the worksheet's cells
+        widths = [len(header) for header in headers]
+        for row_data in sample_data:
+            for idx, value in enumerate(row_data):
+                widths[idx] = max(widths[idx], len(value))
+        for idx, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(idx)].width = min(width + 2, 50)
         
-        wb.save(file_path)
-        logger.info(f"Created sample excel file at {file_path}")
+        wb.save(destination)
+        logger.info("Created sample excel file")
         
     except Exception as e:
-        logger.error(f"Error creating sample excel: {e}")
+        logger.error("Error creating sample excel: %s", e)
         raise
+
+
+@lru_cache(maxsize=1)
+def get_sample_excel_bytes() -> bytes:
+    """
+    Return the sample template's contents, building it on first use.
+    
+    The template never changes while the bot runs, so it is built once.
+    """
+    buffer = BytesIO()
+    create_sample_excel(buffer)
+    return buffer.getvalue()
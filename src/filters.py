@@ -0,0 +1,44 @@
+"""
+Shared message filters for the English Learning Bot.
+
+Filters are built once at import time and reused by every handler
+that needs them, instead of being reconstructed inside each
+ConversationHandler factory.
+"""
+
+from telegram import Message
+from telegram.ext import filters
+
+from src.constants import ButtonText
+
+
+class ExactText(filters.MessageFilter):
+    """
+    Match messages whose text equals one fixed string.
+    
+    Button labels are fixed strings, so a single string comparison is
+    enough; no regex or set lookup runs against every incoming message.
+    """
+    
+    __slots__ = ("text",)
+    
+    def __init__(self, text: str):
+        self.text = text
+        super().__init__(name=f"ExactText({text!r})")
+    
+    def filter(self, message: Message) -> bool:
+        return message.text == self.text
+
+
+# Plain text that is not a /command, in new messages only (not edits or
+# channel posts); the cheap update-type check runs first
+TEXT_NOT_COMMAND = filters.UpdateType.MESSAGE & filters.TEXT & ~filters.COMMAND
+
+# Main menu buttons used as conversation entry points
+ADD_WORDS_BUTTON = ExactText(ButtonText.ADD_WORDS)
+EDIT_WORD_BUTTON = ExactText(ButtonText.EDIT_WORD)
+SETTINGS_BUTTON = ExactText(ButtonText.SETTINGS)
+
+# Excel uploads. The extension check is used alone: Telegram clients do not
+# report a consistent MIME type for .xlsx (often application/octet-stream).
+EXCEL_DOCUMENT = filters.Document.FileExtension("xlsx")
@@ -5,23 +5,22 @@ This module provides common utilities, decorators, and error handling
 used across all handler modules.
 """
 
+import asyncio
+import logging
 from functools import wraps
 from typing import Optional, Callable, Any, TypeVar, Tuple
-import traceback
 
 from telegram import Update
 from telegram.ext import ContextTypes, ConversationHandler
-from telegram.error import TelegramError
-from sqlalchemy import select
+from telegram.error import BadRequest, TelegramError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_session
 from src.models import User
 from src.keyboards import get_main_menu_keyboard
 from src.constants import Messages, SessionKey
-from src.logger import setup_logger
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
 
 # Type variable for handler functions
 F = TypeVar('F', bound=Callable[..., Any])
@@ -38,9 +37,7 @@ async def get_user_from_db(session: AsyncSession, user_id: int) -> Optional[User
     Returns:
         User object if found, None otherwise
     """
-    stmt = select(User).where(User.id == user_id)
-    result = await session.execute(stmt)
-    return result.scalar_one_or_none()
+    return await session.get(User, user_id)
 
 
 async def get_user_or_error(
@@ -83,17 +80,13 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> N
         update: The update that caused the error
         context: Bot context containing the error
     """
-    # Log the error
+    # Log the error with its traceback. exc_info defers formatting the
+    # traceback to the handlers, so it only happens if the record is emitted.
     logger.error(
-        f"Exception while handling an update: {context.error}",
+        "Exception while handling an update: %s", context.error,
         exc_info=context.error
     )
     
-    # Log the full traceback
-    tb_list = traceback.format_exception(None, context.error, context.error.__traceback__)
-    tb_string = "".join(tb_list)
-    logger.error(f"Traceback:\n{tb_string}")
-    
     # Send error message to user if possible
     if isinstance(update, Update):
         error_message = Messages.ERROR_GENERIC
@@ -107,7 +100,52 @@ async def error_handler(update: object, context: ContextTypes.DEFAULT_TYPE) -> N
                     reply_markup=get_main_menu_keyboard()
                 )
         except TelegramError as e:
-            logger.error(f"Failed to send error message to user: {e}")
+            logger.error("Failed to send error message to user: %s", e)
+
+
+def cache_user_settings(context: ContextTypes.DEFAULT_TYPE, user: User) -> dict:
+    """
+    Store the user's preferences in user_data after reading or writing them.
+    
+    Args:
+        context: Bot context
+        user: User loaded from or just saved to the database
+        
+    Returns:
+        The cached settings dictionary
+    """
+    settings = {
+        "daily_word_limit": user.daily_word_limit,
+        "reminder_enabled": user.reminder_enabled,
+        "reminder_time": user.reminder_time,
+    }
+    set_session_value(context, SessionKey.USER_SETTINGS, settings)
+    return settings
+
+
+async def get_user_settings(context: ContextTypes.DEFAULT_TYPE, user_id: int) -> Optional[dict]:
+    """
+    Get the user's preferences, querying the database only on a cache miss.
+    
+    The settings handlers refresh the cache whenever they save a change.
+    The cache lives in user_data, so it is dropped with the rest of the
+    session data and simply reloaded on the next call.
+    
+    Args:
+        context: Bot context
+        user_id: Telegram user ID
+        
+    Returns:
+        Settings dictionary, or None if the user is not registered
+    """
+    settings = get_session_value(context, SessionKey.USER_SETTINGS)
+    if settings is None:
+        async with get_session() as session:
+            user = await get_user_from_db(session, user_id)
+        if user is None:
+            return None
+        settings = cache_user_settings(context, user)
+    return settings
 
 
 def clear_session_data(context: ContextTypes.DEFAULT_TYPE, keys: list = None) -> None:
@@ -125,43 +163,67 @@ def clear_session_data(context: ContextTypes.DEFAULT_TYPE, keys: list = None) ->
             context.user_data.pop(key, None)
 
 
-def get_session_value(context: ContextTypes.DEFAULT_TYPE, key: SessionKey, default=None):
+def release_user_data(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """
+    Drop the user's session dict from the application once it is empty.
+    
+    PTB keeps one user_data dict per user for the lifetime of the process.
+    Releasing it after a session ends keeps memory proportional to the
+    users with an active session rather than every user ever seen.
+    
+    Only call this from a handler: the update processor runs one update
+    per user at a time, so no other handler holds the dict being dropped.
+    Background tasks must not write to user_data.
+    
+    Args:
+        update: Telegram update
+        context: Bot context
+    """
+    if update.effective_user and not context.user_data:
+        context.application.drop_user_data(update.effective_user.id)
+
+
+def get_session_value(context: ContextTypes.DEFAULT_TYPE, key: str, default=None):
     """
     Safely get a value from session data.
     
     Args:
         context: Bot context
-        key: Session key (from SessionKey enum)
+        key: Session key (a SessionKey constant)
         default: Default value if key not found
         
     Returns:
         The stored value or default
     """
-    return context.user_data.get(key.value if isinstance(key, SessionKey) else key, default)
+    return context.user_data.get(key, default)
 
 
-def set_session_value(context: ContextTypes.DEFAULT_TYPE, key: SessionKey, value) -> None:
+def set_session_value(context: ContextTypes.DEFAULT_TYPE, key: str, value) -> None:
     """
     Safely set a value in session data.
     
     Args:
         context: Bot context
-        key: Session key (from SessionKey enum)
+        key: Session key (a SessionKey constant)
         value: Value to store
     """
-    context.user_data[key.value if isinstance(key, SessionKey) else key] = value
+    context.user_data[key] = value
 
 
 async def send_message(
     update: Update,
     text: str,
     reply_markup=None,
-    parse_mode: str = "Markdown",
+    parse_mode: str = "HTML",
     edit: bool = False
 ) -> None:
     """
     Send or edit a message based on the update type.
     
+    Text is parsed as HTML by default, so callers must html.escape any
+    dynamic values they insert. If Telegram still rejects the markup,
+    the message is sent once more as plain text.
+    
     Args:
         update: Telegram update
         text: Message text
@@ -169,52 +231,88 @@ async def send_message(
         parse_mode: Message parse mode
         edit: Whether to edit the existing message (for callback queries)
     """
+    if update.callback_query:
+        message = update.callback_query.message
+        send = message.edit_text if edit else message.reply_text
+    elif update.message:
+        send = update.message.reply_text
+    else:
+        return
+    
     try:
-        if update.callback_query and edit:
-            await update.callback_query.message.edit_text(
-                text,
-                reply_markup=reply_markup,
-                parse_mode=parse_mode
-            )
-        elif update.callback_query:
-            await update.callback_query.message.reply_text(
-                text,
-                reply_markup=reply_markup,
-                parse_mode=parse_mode
-            )
-        elif update.message:
-            await update.message.reply_text(
-                text,
-                reply_markup=reply_markup,
-                parse_mode=parse_mode
-            )
+        try:
+            await send(text, reply_markup=reply_markup, parse_mode=parse_mode)
+        except BadRequest as e:
+            # Unescaped or malformed markup; degrade to plain text
+            if not parse_mode or "parse entities" not in str(e).lower():
+                raise
+            logger.warning("Message markup rejected, sending as plain text: %s", e)
+            await send(text, reply_markup=reply_markup, parse_mode=None)
+    except TelegramError as e:
+        logger.error("Failed to send message: %s", e)
+
+
+async def _answer_callback_query(update: Update) -> None:
+    """Stop the button's loading spinner; failure only affects the spinner."""
+    try:
+        await update.callback_query.answer()
     except TelegramError as e:
-        logger.error(f"Failed to send message: {e}")
-        # Try without parse mode if formatting failed
-        if "parse" in str(e).lower():
-            await send_message(update, text, reply_markup, parse_mode=None, edit=edit)
+        logger.warning("Failed to answer callback query: %s", e)
+
+
+def answers_callback(func: F) -> F:
+    """
+    Decorator answering the callback query while the handler runs.
+    
+    The answer request is sent concurrently with the handler's own
+    database and Telegram calls instead of delaying them by a round trip.
+    Updates without a callback query pass through unchanged.
+    """
+    @wraps(func)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
+        if not update.callback_query:
+            return await func(update, context, *args, **kwargs)
+        
+        answering = asyncio.create_task(_answer_callback_query(update))
+        try:
+            return await func(update, context, *args, **kwargs)
+        finally:
+            await answering
+    
+    return wrapper
+
+
+def _user_label(update: Update) -> Any:
+    """Return the update's user ID for log messages, or "unknown"."""
+    return update.effective_user.id if update.effective_user else "unknown"
 
 
 def log_handler(func_name: str):
     """
     Decorator to log handler entry and exit.
     
+    Entry and exit are logged at DEBUG; when that level is disabled the
+    wrapper only checks the level once and skips resolving the user.
+    
     Args:
         func_name: Name of the handler for logging
     """
     def decorator(func: F) -> F:
         @wraps(func)
         async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE, *args, **kwargs):
-            user_id = update.effective_user.id if update.effective_user else "unknown"
-            logger.debug(f"Handler {func_name} called by user {user_id}")
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Handler %s called by user %s", func_name, _user_label(update))
             
             try:
                 result = await func(update, context, *args, **kwargs)
-                logger.debug(f"Handler {func_name} completed for user {user_id}")
-                return result
             except Exception as e:
-                logger.error(f"Handler {func_name} failed for user {user_id}: {e}")
+                logger.error("Handler %s failed for user %s: %s", func_name, _user_label(update), e)
                 raise
+            
+            if debug:
+                logger.debug("Handler %s completed for user %s", func_name, _user_label(update))
+            return result
         
         return wrapper
     return decorator
@@ -8,13 +8,15 @@ This module handles:
 - Session completion
 """
 
-from datetime import datetime
+import asyncio
+import logging
+from dataclasses import dataclass
+from html import escape
+from typing import Dict, List, Optional
 from telegram import Update
 from telegram.ext import ContextTypes, ConversationHandler
-from sqlalchemy import select
 
 from src.database import get_session
-from src.models import Word, StudySession
 from src.keyboards import (
     get_main_menu_keyboard,
     get_answer_keyboard,
@@ -27,19 +29,81 @@ from src.callback_data import (
     DifficultyCallback,
     NavigationCallback,
 )
-from src.services import create_study_session, record_review, end_session
+from src.services import (
+    SessionWord,
+    create_study_session,
+    get_session_words,
+    record_review,
+    end_session,
+)
 from src.handlers.base import (
-    get_session_value,
-    set_session_value,
+    get_user_settings,
     clear_session_data,
+    release_user_data,
+    answers_callback,
     log_handler,
 )
-from src.logger import setup_logger
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class LearningState:
+    """
+    Progress of the user's current learning session, kept in user_data.
+    
+    One object under SessionKey.LEARNING replaces a user_data entry per
+    field; the handlers fetch it with a plain user_data lookup and read
+    and update its attributes.
+    """
+    study_session_id: int
+    words_to_review: List[int]
+    new_words: List[int]
+    # Word details by id, prefetched and HTML-escaped when the session starts
+    word_cache: Dict[int, SessionWord]
+    word_index: int = 0
+    current_word: Optional[int] = None
+    last_answer_correct: bool = False
+    # Background task saving the latest review (see handle_difficulty)
+    pending_review: Optional[asyncio.Task] = None
+    
+    @property
+    def total_words(self) -> int:
+        return len(self.words_to_review) + len(self.new_words)
+    
+    async def wait_for_pending_review(self) -> None:
+        """Wait until the last scheduled review has been saved."""
+        if self.pending_review is not None:
+            await self.pending_review
+            self.pending_review = None
+
+
+def _escape_word(word: SessionWord) -> SessionWord:
+    """Return the word with every field escaped for HTML messages."""
+    return SessionWord._make(escape(value) if value else value for value in word)
+
+
+async def _save_review(
+    session_id: int,
+    word_id: int,
+    user_id: int,
+    is_correct: bool,
+    difficulty: str,
+    is_new: bool,
+) -> None:
+    """Record a review in its own database session; failures are only logged."""
+    try:
+        async with get_session() as session:
+            await record_review(
+                session, session_id, word_id, user_id,
+                is_correct, difficulty, is_new
+            )
+    except Exception as e:
+        logger.error("Error saving review of word %s for user %s: %s", word_id, user_id, e)
 
 
 @log_handler("start_learning")
+@answers_callback
 async def start_learning(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     Start a new learning session.
@@ -48,7 +112,7 @@ async def start_learning(update: Update, context: ContextTypes.DEFAULT_TYPE):
     Creates a study session record in the database.
     """
     user_id = update.effective_user.id
-    logger.info(f"User {user_id} starting learning session")
+    logger.info("User %s starting learning session", user_id)
     
     # Get the message method (could be from callback or text)
     reply_func = (
@@ -57,127 +121,138 @@ async def start_learning(update: Update, context: ContextTypes.DEFAULT_TYPE):
         else update.message.reply_text
     )
     
-    if update.callback_query:
-        await update.callback_query.answer()
-    
     try:
+        # Get user settings (cached; falls back to the default limit)
+        settings = await get_user_settings(context, user_id)
+        limit = settings["daily_word_limit"] if settings else 10
+        
         async with get_session() as session:
-            # Get user settings
-            stmt = select(Word).where(Word.added_by == user_id)
-            result = await session.execute(stmt)
-            all_words = result.scalars().all()
-            
-            limit = 10  # Default limit for demo
-            
             # Create study session using service
             session_id, review_word_ids, new_word_ids = await create_study_session(
                 session, user_id, limit
             )
             
-            # Check if there are any words to study
-            if not review_word_ids and not new_word_ids:
-                await reply_func(
-                    Messages.NO_WORDS_TO_REVIEW,
-                    reply_markup=get_main_menu_keyboard()
-                )
-                return
-            
-            # Store session data in context
-            set_session_value(context, SessionKey.STUDY_SESSION_ID, session_id)
-            set_session_value(context, SessionKey.WORDS_TO_REVIEW, review_word_ids)
-            set_session_value(context, SessionKey.NEW_WORDS, new_word_ids)
-            set_session_value(context, SessionKey.WORD_INDEX, 0)
-            
-            logger.info(f"Session created for user {user_id}: {session_id}")
+            # Fetch every session word once; showing and answering words
+            # then reads this cache instead of the database
+            session_words = await get_session_words(session, review_word_ids + new_word_ids)
         
-        # Notify user about session
-        total_words = len(review_word_ids) + len(new_word_ids)
-        await reply_func(
-            Messages.SESSION_STARTING.format(
-                review_count=len(review_word_ids),
-                new_count=len(new_word_ids),
-                total_count=total_words
+        # Escape once here; every render then inserts the values as they are
+        word_cache = {word_id: _escape_word(word) for word_id, word in session_words.items()}
+        
+        # Check if there are any words to study
+        if not review_word_ids and not new_word_ids:
+            await reply_func(
+                Messages.NO_WORDS_TO_REVIEW,
+                reply_markup=get_main_menu_keyboard()
             )
+            return
+        
+        # Store session data in context
+        context.user_data[SessionKey.LEARNING] = LearningState(
+            session_id, review_word_ids, new_word_ids, word_cache
         )
         
-        # Show first word
-        await show_next_word(update, context)
+        logger.info("Session created for user %s: %s", user_id, session_id)
+        
+        # Show first word, headed by the session overview so starting a
+        # session costs one message instead of two
+        total_words = len(review_word_ids) + len(new_word_ids)
+        intro = Messages.session_starting(
+            review_count=len(review_word_ids),
+            new_count=len(new_word_ids),
+            total_count=total_words
+        )
+        await show_next_word(update, context, intro=intro)
         
     except Exception as e:
-        logger.error(f"Error starting learning session: {e}")
+        logger.error("Error starting learning session: %s", e)
         await reply_func(Messages.ERROR_GENERIC)
 
 
 @log_handler("show_next_word")
-async def show_next_word(update: Update, context: ContextTypes.DEFAULT_TYPE):
+async def show_next_word(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    intro: str = ""
+):
     """
     Display the next word in the learning session.
     
     Determines if showing review word or new word,
     then presents it with answer buttons.
+    
+    Args:
+        update: Telegram update
+        context: Bot context
+        intro: Text shown above the word (the session overview for the first word)
     """
-    user_id = update.effective_user.id
-    word_index = get_session_value(context, SessionKey.WORD_INDEX, 0)
-    words_to_review = get_session_value(context, SessionKey.WORDS_TO_REVIEW, [])
-    new_words = get_session_value(context, SessionKey.NEW_WORDS, [])
+    state: Optional[LearningState] = context.user_data.get(SessionKey.LEARNING)
+    if state is None:
+        await end_learning_session(update, context)
+        return
     
-    total_words = len(words_to_review) + len(new_words)
+    words_to_review = state.words_to_review
+    total_words = state.total_words
+    word_index = state.word_index
+    
+    # Word details were prefetched when the session started; skip any word
+    # that has since disappeared
+    word = None
+    while word_index < total_words:
+        # Determine if showing review word or new word
+        if word_index < len(words_to_review):
+            word_id = words_to_review[word_index]
+            is_new = False
+        else:
+            word_id = state.new_words[word_index - len(words_to_review)]
+            is_new = True
+        
+        word = state.word_cache.get(word_id)
+        if word:
+            break
+        
+        logger.warning("Word %s not found, skipping", word_id)
+        word_index += 1
+    
+    state.word_index = word_index
     
     # Check if session is complete
-    if word_index >= total_words:
+    if not word:
         await end_learning_session(update, context)
         return
     
     try:
-        async with get_session() as session:
-            # Determine if showing review word or new word
-            if word_index < len(words_to_review):
-                word_id = words_to_review[word_index]
-                is_new = False
-            else:
-                word_id = new_words[word_index - len(words_to_review)]
-                is_new = True
-            
-            # Get word details from database
-            stmt = select(Word).where(Word.id == word_id)
-            result = await session.execute(stmt)
-            word = result.scalar_one_or_none()
-            
-            if not word:
-                logger.warning(f"Word {word_id} not found, skipping")
-                set_session_value(context, SessionKey.WORD_INDEX, word_index + 1)
-                await show_next_word(update, context)
-                return
-            
-            # Store current word in session
-            set_session_value(context, SessionKey.CURRENT_WORD, word_id)
-            
-            # Format word display
-            word_type = "✨ New Word" if is_new else "🔄 Review"
-            progress_text = f"Progress: {word_index + 1}/{total_words}"
-            
-            message = (
-                f"{word_type} | {progress_text}\n\n"
-                f"📝 Word: **{word.word}**\n\n"
-                "Do you know the meaning?"
+        # Store current word in session
+        state.current_word = word_id
+        
+        # Format word display
+        word_type = "✨ New Word" if is_new else "🔄 Review"
+        progress_text = f"Progress: {word_index + 1}/{total_words}"
+        
+        message = (
+            f"{word_type} | {progress_text}\n\n"
+            f"📝 Word: <b>{word.word}</b>\n\n"
+            "Do you know the meaning?"
+        )
+        if intro:
+            message = f"{intro}\n\n{message}"
+        
+        # Send or edit message based on update type
+        if update.callback_query:
+            await update.callback_query.message.edit_text(
+                message,
+                reply_markup=get_answer_keyboard(),
+                parse_mode="HTML"
+            )
+        else:
+            await update.message.reply_text(
+                message,
+                reply_markup=get_answer_keyboard(),
+                parse_mode="HTML"
             )
-            
-            # Send or edit message based on update type
-            if update.callback_query:
-                await update.callback_query.message.edit_text(
-                    message,
-                    reply_markup=get_answer_keyboard(),
-                    parse_mode="Markdown"
-                )
-            else:
-                await update.message.reply_text(
-                    message,
-                    reply_markup=get_answer_keyboard(),
-                    parse_mode="Markdown"
-                )
                 
     except Exception as e:
-        logger.error(f"Error showing next word: {e}")
+        logger.error("Error showing next word: %s", e)
         if update.callback_query:
             await update.callback_query.message.reply_text(Messages.ERROR_GENERIC)
         else:
@@ -185,17 +260,18 @@ async def show_next_word(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 
 @log_handler("handle_answer")
+@answers_callback
 async def handle_answer(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     Handle user's answer to whether they know the word.
     
-    Parses the callback data, retrieves word details,
+    Parses the callback data, reads the word from the session cache,
     and shows the answer with difficulty rating buttons.
     """
     query = update.callback_query
-    await query.answer()
     
-    word_id = get_session_value(context, SessionKey.CURRENT_WORD)
+    state: Optional[LearningState] = context.user_data.get(SessionKey.LEARNING)
+    word_id = state.current_word if state else None
     
     if not word_id:
         await query.message.edit_text(Messages.ERROR_SESSION_EXPIRED)
@@ -204,53 +280,51 @@ async def handle_answer(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Parse callback data using type-safe handler
     callback = AnswerCallback.decode(query.data)
     if not callback:
-        logger.error(f"Failed to parse answer callback: {query.data}")
+        logger.error("Failed to parse answer callback: %s", query.data)
         return
     
     is_correct = callback.is_correct
     
+    # Word details were prefetched when the session started
+    word = state.word_cache.get(word_id)
+    
+    if not word:
+        await query.message.edit_text(Messages.ERROR_WORD_NOT_FOUND)
+        return
+    
     try:
-        async with get_session() as session:
-            # Get word details
-            stmt = select(Word).where(Word.id == word_id)
-            result = await session.execute(stmt)
-            word = result.scalar_one_or_none()
-            
-            if not word:
-                await query.message.edit_text(Messages.ERROR_WORD_NOT_FOUND)
-                return
-            
-            # Build answer message
-            answer_emoji = "✅" if is_correct else "❌"
-            message = (
-                f"{answer_emoji} {'Correct!' if is_correct else 'Keep trying!'}\n\n"
-                f"📝 **{word.word}**\n\n"
-                f"📖 Definition:\n{word.definition}\n\n"
-            )
-            
-            if word.example:
-                message += f"💬 Example:\n_{word.example}_\n\n"
-            
-            if word.translation:
-                message += f"🌐 Translation:\n{word.translation}\n\n"
-            
-            message += "How difficult is this word for you?"
-            
-            await query.message.edit_text(
-                message,
-                reply_markup=get_difficulty_keyboard(word_id, is_correct),
-                parse_mode="Markdown"
-            )
+        # Build answer message
+        answer_emoji = "✅" if is_correct else "❌"
+        message = (
+            f"{answer_emoji} {'Correct!' if is_correct else 'Keep trying!'}\n\n"
+            f"📝 <b>{word.word}</b>\n\n"
+            f"📖 Definition:\n{word.definition}\n\n"
+        )
+        
+        if word.example:
+            message += f"💬 Example:\n<i>{word.example}</i>\n\n"
+        
+        if word.translation:
+            message += f"🌐 Translation:\n{word.translation}\n\n"
+        
+        message += "How difficult is this word for you?"
+        
+        await query.message.edit_text(
+            message,
+            reply_markup=get_difficulty_keyboard(word_id, is_correct),
+            parse_mode="HTML"
+        )
         
         # Store answer for later use
-        set_session_value(context, SessionKey.LAST_ANSWER_CORRECT, is_correct)
+        state.last_answer_correct = is_correct
         
     except Exception as e:
-        logger.error(f"Error handling answer: {e}")
+        logger.error("Error handling answer: %s", e)
         await query.message.edit_text(Messages.ERROR_GENERIC)
 
 
 @log_handler("handle_difficulty")
+@answers_callback
 async def handle_difficulty(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     Handle user's difficulty rating for a word.
@@ -259,14 +333,21 @@ async def handle_difficulty(update: Update, context: ContextTypes.DEFAULT_TYPE):
     advances to the next word.
     """
     query = update.callback_query
-    await query.answer()
     
     user_id = update.effective_user.id
     
     # Parse callback data using type-safe handler
     callback = DifficultyCallback.decode(query.data)
     if not callback:
-        logger.error(f"Failed to parse difficulty callback: {query.data}")
+        logger.error("Failed to parse difficulty callback: %s", query.data)
+        await query.message.edit_text(
+            Messages.ERROR_SESSION_EXPIRED,
+            reply_markup=get_main_menu_keyboard()
+        )
+        return
+    
+    state: Optional[LearningState] = context.user_data.get(SessionKey.LEARNING)
+    if state is None:
         await query.message.edit_text(
             Messages.ERROR_SESSION_EXPIRED,
             reply_markup=get_main_menu_keyboard()
@@ -275,26 +356,34 @@ async def handle_difficulty(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     word_id = callback.word_id
     is_correct = callback.is_correct
-    difficulty = callback.difficulty.value
+    difficulty = callback.difficulty
+    
+    # Only the word on screen can be rated, once; a repeated tap or a button
+    # left on an older message would record a second review and skip a word
+    if word_id != state.current_word:
+        logger.info("Ignoring stale difficulty rating for word %s", word_id)
+        return
+    state.current_word = None
     
     try:
-        async with get_session() as session:
-            # Determine if this was a new word
-            word_index = get_session_value(context, SessionKey.WORD_INDEX, 0)
-            words_to_review = get_session_value(context, SessionKey.WORDS_TO_REVIEW, [])
-            is_new = word_index >= len(words_to_review)
-            
-            session_id = get_session_value(context, SessionKey.STUDY_SESSION_ID)
-            
-            # Record review using service
-            await record_review(
-                session, session_id, word_id, user_id,
+        # Determine if this was a new word
+        is_new = state.word_index >= len(state.words_to_review)
+        
+        # Save the review in the background so the reply below does not
+        # wait for the commit. Reviews of one session are saved in order,
+        # and end_learning_session waits for the last one before reading
+        # the session's counters.
+        await state.wait_for_pending_review()
+        state.pending_review = context.application.create_task(
+            _save_review(
+                state.study_session_id, word_id, user_id,
                 is_correct, difficulty, is_new
-            )
+            ),
+            update=update,
+        )
         
         # Advance to next word
-        current_index = get_session_value(context, SessionKey.WORD_INDEX, 0)
-        set_session_value(context, SessionKey.WORD_INDEX, current_index + 1)
+        state.word_index += 1
         
         await query.message.edit_text(
             "Great! Moving to next word... ➡️",
@@ -302,11 +391,12 @@ async def handle_difficulty(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         
     except Exception as e:
-        logger.error(f"Error handling difficulty: {e}")
+        logger.error("Error handling difficulty: %s", e)
         await query.message.edit_text(Messages.ERROR_GENERIC)
 
 
 @log_handler("handle_next_word")
+@answers_callback
 async def handle_next_word(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     Handle navigation buttons (Next Word / Stop Learning).
@@ -314,12 +404,11 @@ async def handle_next_word(update: Update, context: ContextTypes.DEFAULT_TYPE):
     Parses callback to determine action and routes accordingly.
     """
     query = update.callback_query
-    await query.answer()
     
     # Parse callback data
     callback = NavigationCallback.decode(query.data)
     if not callback:
-        logger.error(f"Failed to parse navigation callback: {query.data}")
+        logger.error("Failed to parse navigation callback: %s", query.data)
         return
     
     if callback.is_next_word:
@@ -336,11 +425,27 @@ async def end_learning_session(update: Update, context: ContextTypes.DEFAULT_TYP
     Updates session end time, calculates statistics,
     and displays session summary.
     """
-    session_id = get_session_value(context, SessionKey.STUDY_SESSION_ID)
+    state: Optional[LearningState] = context.user_data.get(SessionKey.LEARNING)
+    session_id = state.study_session_id if state else None
     summary = "Session ended."
     
+    query = update.callback_query
+    menu_reply = None
+    if query:
+        # The menu prompt is a new message below the one the summary goes
+        # into and does not depend on the stats, so send it while the
+        # session is being closed
+        menu_reply = asyncio.create_task(
+            query.message.reply_text(
+                "What would you like to do next?",
+                reply_markup=get_main_menu_keyboard()
+            )
+        )
+    
     try:
         if session_id:
+            # The counters must include the last review saved in the background
+            await state.wait_for_pending_review()
             async with get_session() as session:
                 # End session using service
                 stats = await end_session(session, session_id)
@@ -358,18 +463,18 @@ async def end_learning_session(update: Update, context: ContextTypes.DEFAULT_TYP
                     )
                     
     except Exception as e:
-        logger.error(f"Error ending session: {e}")
+        logger.error("Error ending session: %s", e)
         summary = "Session ended (with error saving stats)."
     
     # Clear session data
     clear_session_data(context)
+    release_user_data(update, context)
     
     # Send summary based on update type
-    if update.callback_query:
-        await update.callback_query.message.edit_text(summary)
-        await update.callback_query.message.reply_text(
-            "What would you like to do next?",
-            reply_markup=get_main_menu_keyboard()
-        )
+    if query:
+        try:
+            await query.message.edit_text(summary)
+        finally:
+            await menu_reply
     else:
         await update.message.reply_text(summary, reply_markup=get_main_menu_keyboard())
@@ -6,6 +6,8 @@ This module handles:
 - Progress tracking and visualization
 """
 
+import logging
+
 from telegram import Update
 from telegram.ext import ContextTypes
 
@@ -14,9 +16,8 @@ from src.keyboards import get_main_menu_keyboard
 from src.constants import Messages
 from src.leitner import get_user_statistics
 from src.handlers.base import log_handler
-from src.logger import setup_logger
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
 
 
 @log_handler("show_progress")
@@ -36,40 +37,40 @@ async def show_progress(update: Update, context: ContextTypes.DEFAULT_TYPE):
         async with get_session() as session:
             # Get user statistics from Leitner module
             stats = await get_user_statistics(session, user_id)
-            
-            # Format Leitner box distribution
-            box_distribution = stats.get("box_distribution", {})
-            box_lines = []
-            for box, count in box_distribution.items():
-                if count > 0:
-                    # Add visual indicator based on box number
-                    level = _get_level_indicator(box)
-                    box_lines.append(f"  Box {box} {level}: {count} words")
-            
-            box_text = "\n".join(box_lines) if box_lines else "  No words yet"
-            
-            # Build progress message
-            message = (
-                f"📊 *Your Learning Progress*\n\n"
-                f"📚 Total Words: {stats['total_words']}\n"
-                f"🏆 Mastered: {stats['mastered_words']}\n"
-                f"📅 Due Today: {stats['due_today']}\n\n"
-                f"📈 *Statistics*\n"
-                f"  Total Reviews: {stats['total_reviews']}\n"
-                f"  ✅ Correct: {stats['total_correct']}\n"
-                f"  ❌ Incorrect: {stats['total_incorrect']}\n"
-                f"  🎯 Accuracy: {stats['accuracy']}%\n\n"
-                f"📦 *Leitner Boxes*\n{box_text}"
-            )
-            
-            await update.message.reply_text(
-                message,
-                reply_markup=get_main_menu_keyboard(),
-                parse_mode="Markdown"
-            )
-            
+        
+        # Format Leitner box distribution
+        box_distribution = stats.get("box_distribution", {})
+        box_lines = []
+        for box, count in box_distribution.items():
+            if count > 0:
+                # Add visual indicator based on box number
+                level = _get_level_indicator(box)
+                box_lines.append(f"  Box {box} {level}: {count} words")
+        
+        box_text = "\n".join(box_lines) if box_lines else "  No words yet"
+        
+        # Build progress message
+        message = (
+            f"📊 <b>Your Learning Progress</b>\n\n"
+            f"📚 Total Words: {stats['total_words']}\n"
+            f"🏆 Mastered: {stats['mastered_words']}\n"
+            f"📅 Due Today: {stats['due_today']}\n\n"
+            f"📈 <b>Statistics</b>\n"
+            f"  Total Reviews: {stats['total_reviews']}\n"
+            f"  ✅ Correct: {stats['total_correct']}\n"
+            f"  ❌ Incorrect: {stats['total_incorrect']}\n"
+            f"  🎯 Accuracy: {stats['accuracy']}%\n\n"
+            f"📦 <b>Leitner Boxes</b>\n{box_text}"
+        )
+        
+        await update.message.reply_text(
+            message,
+            reply_markup=get_main_menu_keyboard(),
+            parse_mode="HTML"
+        )
+        
     except Exception as e:
-        logger.error(f"Error showing progress: {e}")
+        logger.error("Error showing progress: %s", e)
         await update.message.reply_text(
             Messages.ERROR_GENERIC,
             reply_markup=get_main_menu_keyboard()
@@ -7,6 +7,8 @@ This module handles:
 - Reminder toggle and time settings
 """
 
+import logging
+
 from telegram import Update
 from telegram.ext import ContextTypes, ConversationHandler
 
@@ -15,10 +17,9 @@ from src.keyboards import get_main_menu_keyboard, get_settings_keyboard
 from src.constants import ConversationState, Messages
 from src.callback_data import SettingsCallback
 from src.services import update_user_settings, toggle_reminder, set_user_reminder_time
-from src.handlers.base import get_user_from_db, log_handler
-from src.logger import setup_logger
+from src.handlers.base import cache_user_settings, get_user_settings, log_handler
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
 
 
 @log_handler("show_settings")
@@ -32,29 +33,29 @@ async def show_settings(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_id = update.effective_user.id
     
     try:
-        async with get_session() as session:
-            user = await get_user_from_db(session, user_id)
-            
-            if not user:
-                await update.message.reply_text(Messages.ERROR_USER_NOT_FOUND)
-                return ConversationHandler.END
-            
-            # Build settings message
-            message = (
-                f"⚙️ Settings\n\n"
-                f"📈 Daily Word Limit: {user.daily_word_limit}\n"
-                f"🔔 Reminder: {'Enabled' if user.reminder_enabled else 'Disabled'}\n"
-                f"⏰ Reminder Time: {user.reminder_time}\n"
-            )
-            
-            await update.message.reply_text(
-                message,
-                reply_markup=get_settings_keyboard(user.reminder_enabled)
-            )
-            return ConversationState.SETTINGS_MENU
+        # Cached preferences; the database is only read on a cache miss
+        settings = await get_user_settings(context, user_id)
+        
+        if not settings:
+            await update.message.reply_text(Messages.ERROR_USER_NOT_FOUND)
+            return ConversationHandler.END
+        
+        # Build settings message
+        message = (
+            f"⚙️ Settings\n\n"
+            f"📈 Daily Word Limit: {settings['daily_word_limit']}\n"
+            f"🔔 Reminder: {'Enabled' if settings['reminder_enabled'] else 'Disabled'}\n"
+            f"⏰ Reminder Time: {settings['reminder_time']}\n"
+        )
+        
+        await update.message.reply_text(
+            message,
+            reply_markup=get_settings_keyboard(settings["reminder_enabled"])
+        )
+        return ConversationState.SETTINGS_MENU
             
     except Exception as e:
-        logger.error(f"Error showing settings: {e}")
+        logger.error("Error showing settings: %s", e)
         await update.message.reply_text(Messages.ERROR_GENERIC)
         return ConversationHandler.END
 
@@ -81,68 +82,67 @@ async def handle_settings_buttons(update: Update, context: ContextTypes.DEFAULT_
     # Parse callback data
     callback = SettingsCallback.decode(query.data)
     if not callback:
-        logger.error(f"Failed to parse settings callback: {query.data}")
+        logger.error("Failed to parse settings callback: %s", query.data)
         return ConversationHandler.END
     
     try:
-        async with get_session() as session:
-            user = await get_user_from_db(session, user_id)
-            
-            if not user:
-                # Send new message with reply keyboard (can't edit to change keyboard type)
-                await query.message.reply_text(
-                    Messages.ERROR_USER_NOT_FOUND,
-                    reply_markup=get_main_menu_keyboard()
-                )
-                return ConversationHandler.END
-            
-            # Handle: Set Word Limit
-            if callback.is_limit:
-                await query.message.edit_text(
-                    "📈 *Set Daily Word Limit*\n\n"
-                    "Please type a number between 1 and 100:",
-                    parse_mode="Markdown"
-                )
-                return ConversationState.WAITING_WORD_LIMIT
-            
-            # Handle: Toggle Reminder
-            elif callback.is_reminder:
-                # Toggle reminder using service
+        if not await get_user_settings(context, user_id):
+            # Send new message with reply keyboard (can't edit to change keyboard type)
+            await query.message.reply_text(
+                Messages.ERROR_USER_NOT_FOUND,
+                reply_markup=get_main_menu_keyboard()
+            )
+            return ConversationHandler.END
+        
+        # Handle: Set Word Limit
+        if callback.is_limit:
+            await query.message.edit_text(
+                "📈 <b>Set Daily Word Limit</b>\n\n"
+                "Please type a number between 1 and 100:",
+                parse_mode="HTML"
+            )
+            return ConversationState.WAITING_WORD_LIMIT
+        
+        # Handle: Toggle Reminder
+        elif callback.is_reminder:
+            # Toggle reminder using service
+            async with get_session() as session:
                 user, enabled = await toggle_reminder(session, user_id)
-                
-                # Rebuild settings message with updated values
-                message = (
-                    f"⚙️ Settings\n\n"
-                    f"📈 Daily Word Limit: {user.daily_word_limit}\n"
-                    f"🔔 Reminder: {'Enabled' if user.reminder_enabled else 'Disabled'}\n"
-                    f"⏰ Reminder Time: {user.reminder_time}\n"
-                )
-                
-                # Update message and keyboard (both inline, so edit works)
-                await query.message.edit_text(
-                    message,
-                    reply_markup=get_settings_keyboard(user.reminder_enabled)
-                )
-                
-                # Stay in settings menu
-                return ConversationState.SETTINGS_MENU
+            cache_user_settings(context, user)
             
-            # Handle: Set Reminder Time
-            elif callback.is_time:
-                await query.message.edit_text(Messages.PROMPT_REMINDER_TIME)
-                return ConversationState.WAITING_REMINDER_TIME
+            # Rebuild settings message with updated values
+            message = (
+                f"⚙️ Settings\n\n"
+                f"📈 Daily Word Limit: {user.daily_word_limit}\n"
+                f"🔔 Reminder: {'Enabled' if user.reminder_enabled else 'Disabled'}\n"
+                f"⏰ Reminder Time: {user.reminder_time}\n"
+            )
             
-            # Handle: Back to Main Menu
-            elif callback.is_back:
-                # Send new message (can't edit inline to reply keyboard)
-                await query.message.reply_text(
-                    "What would you like to do next?",
-                    reply_markup=get_main_menu_keyboard()
-                )
-                return ConversationHandler.END
+            # Update message and keyboard (both inline, so edit works)
+            await query.message.edit_text(
+                message,
+                reply_markup=get_settings_keyboard(user.reminder_enabled)
+            )
+            
+            # Stay in settings menu
+            return ConversationState.SETTINGS_MENU
+        
+        # Handle: Set Reminder Time
+        elif callback.is_time:
+            await query.message.edit_text(Messages.PROMPT_REMINDER_TIME)
+            return ConversationState.WAITING_REMINDER_TIME
+        
+        # Handle: Back to Main Menu
+        elif callback.is_back:
+            # Send new message (can't edit inline to reply keyboard)
+            await query.message.reply_text(
+                "What would you like to do next?",
+                reply_markup=get_main_menu_keyboard()
+            )
+            return ConversationHandler.END
             
     except Exception as e:
-        logger.error(f"Error handling settings button: {e}")
+        logger.error("Error handling settings button: %s", e)
         # Send new message with reply keyboard on error
         await query.message.reply_text(
             Messages.ERROR_GENERIC,
@@ -171,22 +171,23 @@ async def set_reminder_time(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
         async with get_session() as session:
             user = await set_user_reminder_time(session, user_id, text)
-                
-            await update.message.reply_text(
-                Messages.SUCCESS_REMINDER_TIME_SET.format(time=user.reminder_time),
-                parse_mode="Markdown",
-                reply_markup=get_main_menu_keyboard()
-            )
+        cache_user_settings(context, user)
+        
+        await update.message.reply_text(
+            Messages.success_reminder_time_set(user.reminder_time),
+            parse_mode="HTML",
+            reply_markup=get_main_menu_keyboard()
+        )
                 
     except ValueError as e:
         # Time format validation failed
         await update.message.reply_text(
             Messages.ERROR_INVALID_TIME,
-            parse_mode="Markdown"
+            parse_mode="HTML"
         )
         return ConversationState.WAITING_REMINDER_TIME
     except Exception as e:
-        logger.error(f"Error setting reminder time: {e}")
+        logger.error("Error setting reminder time: %s", e)
         await update.message.reply_text(
             Messages.ERROR_GENERIC,
             reply_markup=get_main_menu_keyboard()
@@ -7,6 +7,8 @@ This module handles:
 - Cancel operation
 """
 
+import logging
+
 from telegram import Update
 from telegram.ext import ContextTypes, ConversationHandler
 
@@ -14,10 +16,9 @@ from src.database import get_session
 from src.keyboards import get_main_menu_keyboard
 from src.constants import ConversationState, Messages
 from src.services import get_or_create_user, update_user_settings
-from src.handlers.base import log_handler
-from src.logger import setup_logger
+from src.handlers.base import cache_user_settings, release_user_data, log_handler
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
 
 
 @log_handler("start_command")
@@ -35,7 +36,7 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not user:
         return ConversationHandler.END
     
-    logger.info(f"User {user.id} started the bot")
+    logger.info("User %s started the bot", user.id)
     
     try:
         async with get_session() as session:
@@ -43,12 +44,13 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             db_user, is_new = await get_or_create_user(
                 session, user.id, user.username, user.first_name, user.last_name
             )
-            
-            if is_new:
-                # Welcome new user and ask for word limit
-                welcome_message = Messages.welcome_new_user(user.first_name or "there")
-                await update.message.reply_text(welcome_message)
-                return ConversationState.WAITING_WORD_LIMIT
+            cache_user_settings(context, db_user)
+        
+        if is_new:
+            # Welcome new user and ask for word limit
+            welcome_message = Messages.welcome_new_user(user.first_name or "there")
+            await update.message.reply_text(welcome_message)
+            return ConversationState.WAITING_WORD_LIMIT
         
         # Welcome back existing user
         welcome_back = Messages.welcome_back(user.first_name or "there")
@@ -59,7 +61,7 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return ConversationHandler.END
         
     except Exception as e:
-        logger.error(f"Error in start_command: {e}")
+        logger.error("Error in start_command: %s", e)
         await update.message.reply_text(Messages.ERROR_GENERIC)
         return ConversationHandler.END
 
@@ -83,19 +85,20 @@ async def set_word_limit(update: Update, context: ContextTypes.DEFAULT_TYPE):
         # Validate range
         if limit < 1 or limit > 100:
             await update.message.reply_text(
-                Messages.ERROR_NUMBER_RANGE.format(min=1, max=100)
+                Messages.error_number_range(1, 100)
             )
             return ConversationState.WAITING_WORD_LIMIT
         
         # Save to database using service
         user_id = update.effective_user.id
         async with get_session() as session:
-            await update_user_settings(session, user_id, daily_word_limit=limit)
-            logger.info(f"User {user_id} set daily limit to {limit}")
+            db_user = await update_user_settings(session, user_id, daily_word_limit=limit)
+            cache_user_settings(context, db_user)
+            logger.info("User %s set daily limit to %s", user_id, limit)
         
         # Send success message
         await update.message.reply_text(
-            Messages.SUCCESS_WORD_LIMIT_SET.format(limit=limit),
+            Messages.success_word_limit_set(limit),
             reply_markup=get_main_menu_keyboard()
         )
         return ConversationHandler.END
@@ -105,7 +108,7 @@ async def set_word_limit(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return ConversationState.WAITING_WORD_LIMIT
         
     except Exception as e:
-        logger.error(f"Error in set_word_limit: {e}")
+        logger.error("Error in set_word_limit: %s", e)
         await update.message.reply_text(Messages.ERROR_GENERIC)
         return ConversationHandler.END
 
@@ -123,6 +126,7 @@ async def cancel_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Clear session data
     if context.user_data:
         context.user_data.clear()
+    release_user_data(update, context)
     
     await update.message.reply_text(
         Messages.SUCCESS_OPERATION_CANCELLED,
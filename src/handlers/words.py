@@ -7,7 +7,11 @@ This module handles:
 - Sample Excel template
 """
 
-from pathlib import Path
+import logging
+import asyncio
+from html import escape
+from io import BytesIO
+from typing import Optional
 
 from telegram import Update
 from telegram.ext import ContextTypes, ConversationHandler
@@ -16,12 +20,15 @@ from src.database import get_session
 from src.keyboards import get_main_menu_keyboard, get_edit_field_keyboard
 from src.constants import ConversationState, SessionKey, Messages
 from src.callback_data import EditFieldCallback
-from src.excel_handler import process_excel_file, validate_excel_structure, create_sample_excel
+from src.excel_handler import process_excel_file, read_excel_file, get_sample_excel_bytes
 from src.services import edit_word_field, get_word_by_text
-from src.handlers.base import get_session_value, set_session_value, clear_session_data, log_handler
-from src.logger import setup_logger
+from src.handlers.base import get_session_value, set_session_value, clear_session_data, release_user_data, log_handler
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
+
+# Telegram file_id of the sample template once it has been uploaded; later
+# requests resend it by id instead of uploading the file again
+_sample_file_id: Optional[str] = None
 
 
 # =============================================================================
@@ -57,28 +64,29 @@ async def handle_excel_file(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("❌ Please send an Excel file (.xlsx)")
         return ConversationState.WAITING_EXCEL_FILE
     
-    # Create temp file path
-    file = await update.message.document.get_file()
-    file_path = Path(f"temp_{user_id}_{update.message.document.file_name}")
-    
     try:
         await update.message.reply_text("⏳ Processing your file...")
         
-        # Download file
-        await file.download_to_drive(file_path)
+        # Download into memory; bot uploads are at most 20 MB, and nothing is
+        # written to (or left behind in) the working directory
+        file = await update.message.document.get_file()
+        buffer = BytesIO()
+        await file.download_to_memory(buffer)
+        buffer.seek(0)
         
-        # Validate Excel structure
-        is_valid, error_msg = validate_excel_structure(file_path)
-        if not is_valid:
+        # Validate and read the file in one pass (parses the workbook, so off
+        # the event loop); other chats keep being served meanwhile
+        rows, error_msg = await asyncio.to_thread(read_excel_file, buffer)
+        if rows is None:
             await update.message.reply_text(f"❌ {error_msg}")
             return ConversationState.WAITING_EXCEL_FILE
         
-        # Process file and add words
+        # Add the words read above
         async with get_session() as session:
-            added_count, duplicates = await process_excel_file(session, file_path, user_id)
+            added_count, duplicates = await process_excel_file(session, rows, user_id)
         
         # Build response message
-        response = Messages.SUCCESS_WORDS_ADDED.format(count=added_count) + "\n\n"
+        response = Messages.success_words_added(added_count) + "\n\n"
         
         if duplicates:
             dup_list = ", ".join(duplicates[:10])
@@ -87,19 +95,14 @@ async def handle_excel_file(update: Update, context: ContextTypes.DEFAULT_TYPE):
             response += f"⚠️ Duplicates skipped ({len(duplicates)}):\n{dup_list}"
         
         await update.message.reply_text(response, reply_markup=get_main_menu_keyboard())
-        logger.info(f"User {user_id} added {added_count} words from Excel")
+        logger.info("User %s added %s words from Excel", user_id, added_count)
         
         return ConversationHandler.END
         
     except Exception as e:
-        logger.error(f"Error processing Excel file: {e}")
+        logger.error("Error processing Excel file: %s", e)
         await update.message.reply_text(f"❌ Error processing file: {str(e)}")
         return ConversationHandler.END
-        
-    finally:
-        # Clean up temp file
-        if file_path.exists():
-            file_path.unlink()
 
 
 @log_handler("send_sample_excel")
@@ -107,30 +110,30 @@ async def send_sample_excel(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     Send a sample Excel template to the user.
     
-    Creates a temporary file with sample data and sends it.
+    The template is built in memory once and uploaded on the first
+    request; after that Telegram's file_id for it is reused.
     """
-    user_id = update.effective_user.id
-    file_path = Path(f"sample_template_{user_id}.xlsx")
+    global _sample_file_id
     
     try:
-        # Create sample file
-        create_sample_excel(file_path)
+        if _sample_file_id is None:
+            # First request: build (openpyxl work, off the event loop) and upload
+            document = await asyncio.to_thread(get_sample_excel_bytes)
+        else:
+            document = _sample_file_id
         
         # Send file to user
-        await update.message.reply_document(
-            document=file_path,
+        message = await update.message.reply_document(
+            document=document,
             filename="english_words_template.xlsx",
             caption="📖 Sample Excel Template\n\nUse this template to add your words!"
         )
+        if message.document:
+            _sample_file_id = message.document.file_id
         
     except Exception as e:
-        logger.error(f"Error creating sample excel: {e}")
+        logger.error("Error creating sample excel: %s", e)
         await update.message.reply_text(f"❌ Error creating sample: {str(e)}")
-        
-    finally:
-        # Clean up temp file
-        if file_path.exists():
-            file_path.unlink()
 
 
 # =============================================================================
@@ -169,37 +172,37 @@ async def select_word_to_edit(update: Update, context: ContextTypes.DEFAULT_TYPE
         async with get_session() as session:
             # Search for word using service
             word = await get_word_by_text(session, word_text)
-            
-            if not word:
-                await update.message.reply_text(
-                    f"❌ Word '{word_text}' not found.\n"
-                    "Please try again or /cancel"
-                )
-                return ConversationState.WAITING_WORD_TO_EDIT
-            
-            # Store word ID for editing
-            set_session_value(context, SessionKey.EDIT_WORD_ID, word.id)
-            
-            # Show current values
-            message = (
-                f"📝 Editing: **{word.word}**\n\n"
-                f"Definition: {word.definition}\n"
-                f"Example: {word.example or 'N/A'}\n"
-                f"Translation: {word.translation or 'N/A'}\n\n"
-                "What do you want to edit?"
-            )
-            
+        
+        if not word:
             await update.message.reply_text(
-                message,
-                reply_markup=get_edit_field_keyboard(),
-                parse_mode="Markdown"
+                f"❌ Word '{word_text}' not found.\n"
+                "Please try again or /cancel"
             )
+            return ConversationState.WAITING_WORD_TO_EDIT
+        
+        # Store word ID for editing
+        set_session_value(context, SessionKey.EDIT_WORD_ID, word.id)
+        
+        # Show current values (loaded attributes stay readable after the session closes)
+        message = (
+            f"📝 Editing: <b>{escape(word.word)}</b>\n\n"
+            f"Definition: {escape(word.definition)}\n"
+            f"Example: {escape(word.example or 'N/A')}\n"
+            f"Translation: {escape(word.translation or 'N/A')}\n\n"
+            "What do you want to edit?"
+        )
+        
+        await update.message.reply_text(
+            message,
+            reply_markup=get_edit_field_keyboard(),
+            parse_mode="HTML"
+        )
         
         # End conversation to let callback handler take over
         return ConversationHandler.END
         
     except Exception as e:
-        logger.error(f"Error in select_word_to_edit: {e}")
+        logger.error("Error in select_word_to_edit: %s", e)
         await update.message.reply_text(Messages.ERROR_GENERIC)
         return ConversationHandler.END
 
@@ -218,7 +221,7 @@ async def handle_edit_field_selection(update: Update, context: ContextTypes.DEFA
     # Parse callback data
     callback = EditFieldCallback.decode(query.data)
     if not callback:
-        logger.error(f"Failed to parse edit callback: {query.data}")
+        logger.error("Failed to parse edit callback: %s", query.data)
         return
     
     # Handle cancel
@@ -227,7 +230,8 @@ async def handle_edit_field_selection(update: Update, context: ContextTypes.DEFA
             Messages.SUCCESS_OPERATION_CANCELLED,
             reply_markup=get_main_menu_keyboard()
         )
-        clear_session_data(context, [SessionKey.EDIT_WORD_ID.value, SessionKey.EDIT_FIELD.value])
+        clear_session_data(context, [SessionKey.EDIT_WORD_ID, SessionKey.EDIT_FIELD])
+        release_user_data(update, context)
         return ConversationHandler.END 
     
     # Store field selection
@@ -236,8 +240,8 @@ async def handle_edit_field_selection(update: Update, context: ContextTypes.DEFA
     
     # Prompt for new value
     await query.message.edit_text(
-        Messages.PROMPT_EDIT_VALUE.format(field=field),
-        parse_mode="Markdown"
+        Messages.prompt_edit_value(field),
+        parse_mode="HTML"
     )
 
 
@@ -264,25 +268,26 @@ async def handle_edit_value(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
         async with get_session() as session:
             # Update word using service
-            word = await edit_word_field(session, word_id, field, new_value, user_id)
-            
-            # Send success message
-            await update.message.reply_text(
-                Messages.SUCCESS_WORD_UPDATED.format(
-                    word=word.word,
-                    field=field,
-                    value=new_value
-                ),
-                reply_markup=get_main_menu_keyboard(),
-                parse_mode="Markdown"
-            )
-            logger.info(f"User {user_id} updated word {word.id} field {field}")
+            word_text = await edit_word_field(session, word_id, field, new_value, user_id)
+        
+        # Send success message
+        await update.message.reply_text(
+            Messages.success_word_updated(
+                word=word_text,
+                field=field,
+                value=new_value
+            ),
+            reply_markup=get_main_menu_keyboard(),
+            parse_mode="HTML"
+        )
+        logger.info("User %s updated word %s field %s", user_id, word_id, field)
             
     except ValueError as e:
         await update.message.reply_text(str(e))
     except Exception as e:
-        logger.error(f"Error updating word: {e}")
+        logger.error("Error updating word: %s", e)
         await update.message.reply_text(Messages.ERROR_GENERIC)
     
     # Clear edit session data
-    clear_session_data(context, [SessionKey.EDIT_WORD_ID.value, SessionKey.EDIT_FIELD.value])
+    clear_session_data(context, [SessionKey.EDIT_WORD_ID, SessionKey.EDIT_FIELD])
+    release_user_data(update, context)
@@ -3,8 +3,13 @@ Telegram keyboard layouts for bot UI.
 
 This module provides all keyboard builders using type-safe callback data
 and centralized button text constants.
+
+Keyboards without parameters are built once and cached; Telegram objects
+are immutable, so the same markup instance can be sent any number of times.
 """
 
+from functools import lru_cache
+
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, ReplyKeyboardMarkup, KeyboardButton
 
 from src.constants import ButtonText, Difficulty
@@ -23,6 +28,7 @@ from src.callback_data import (
 # Reply Keyboards (Persistent menu keyboards)
 # =============================================================================
 
+@lru_cache(maxsize=1)
 def get_main_menu_keyboard() -> ReplyKeyboardMarkup:
     """
     Build the main menu reply keyboard.
@@ -50,6 +56,7 @@ def get_main_menu_keyboard() -> ReplyKeyboardMarkup:
         is_persistent=True
     )
 
+@lru_cache(maxsize=1)
 def get_edit_word_cancel_keyboard() -> ReplyKeyboardMarkup:
     """
     Build the cancel edit word reply keyboard.
@@ -73,6 +80,7 @@ def get_edit_word_cancel_keyboard() -> ReplyKeyboardMarkup:
 # Inline Keyboards (Message-attached keyboards)
 # =============================================================================
 
+@lru_cache(maxsize=1)
 def get_answer_keyboard() -> InlineKeyboardMarkup:
     """
     Build the answer keyboard for "Do you know this word?" prompt.
@@ -95,10 +103,21 @@ def get_answer_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+# Label and difficulty of each rating button, in display order
+_DIFFICULTY_OPTIONS = (
+    (ButtonText.EASY, Difficulty.EASY),
+    (ButtonText.NORMAL, Difficulty.NORMAL),
+    (ButtonText.HARD, Difficulty.HARD),
+)
+
+
 def get_difficulty_keyboard(word_id: int, is_correct: bool) -> InlineKeyboardMarkup:
     """
     Build the difficulty rating keyboard.
     
+    The buttons carry the word id, so this keyboard is built per word
+    rather than cached.
+    
     Args:
         word_id: ID of the word being rated
         is_correct: Whether the user answered correctly
@@ -109,34 +128,20 @@ def get_difficulty_keyboard(word_id: int, is_correct: bool) -> InlineKeyboardMar
     keyboard = [
         [
             InlineKeyboardButton(
-                ButtonText.EASY,
+                text,
                 callback_data=DifficultyCallback(
-                    difficulty=Difficulty.EASY,
-                    word_id=word_id,
-                    is_correct=is_correct
-                ).encode()
-            ),
-            InlineKeyboardButton(
-                ButtonText.NORMAL,
-                callback_data=DifficultyCallback(
-                    difficulty=Difficulty.NORMAL,
-                    word_id=word_id,
-                    is_correct=is_correct
-                ).encode()
-            ),
-            InlineKeyboardButton(
-                ButtonText.HARD,
-                callback_data=DifficultyCallback(
-                    difficulty=Difficulty.HARD,
+                    difficulty=difficulty,
                     word_id=word_id,
                     is_correct=is_correct
                 ).encode()
             )
+            for text, difficulty in _DIFFICULTY_OPTIONS
         ]
     ]
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=1)
 def get_continue_keyboard() -> InlineKeyboardMarkup:
     """
     Build the continue/stop keyboard for learning sessions.
@@ -159,6 +164,7 @@ def get_continue_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=1)
 def get_start_learning_keyboard() -> InlineKeyboardMarkup:
     """
     Build the start learning keyboard for reminders.
@@ -181,6 +187,7 @@ def get_start_learning_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=1)
 def get_edit_field_keyboard() -> InlineKeyboardMarkup:
     """
     Build the edit field selection keyboard.
@@ -220,10 +227,13 @@ def get_edit_field_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=2)
 def get_settings_keyboard(reminder_enabled: bool) -> InlineKeyboardMarkup:
     """
     Build the settings menu keyboard.
     
+    Only two variants exist (reminder on or off), so both are cached.
+    
     Args:
         reminder_enabled: Current state of reminder setting
         
@@ -261,6 +271,7 @@ def get_settings_keyboard(reminder_enabled: bool) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(keyboard)
 
 
+@lru_cache(maxsize=1)
 def get_confirmation_keyboard() -> InlineKeyboardMarkup:
     """
     Build a generic Yes/No confirmation keyboard.
@@ -1,15 +1,15 @@
 """Leitner Study Method Implementation"""
 
+import logging
 from datetime import date, timedelta
 from typing import List, Optional, Dict, Any
 from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import UserWordProgress, Word, DifficultyLevel
-from src.config import LEITNER_BOXES
-from src.logger import setup_logger
+from src.config import LEITNER_INTERVALS
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
 
 async def get_words_for_review(
     session: AsyncSession, 
@@ -44,11 +44,11 @@ async def get_words_for_review(
         result = await session.execute(stmt)
         words_to_review = list(result.scalars().all())
         
-        logger.info(f"Retrieved {len(words_to_review)} words for review for user {user_id}")
+        logger.info("Retrieved %s words for review for user %s", len(words_to_review), user_id)
         return words_to_review
         
     except Exception as e:
-        logger.error(f"Error getting words for review: {e}")
+        logger.error("Error getting words for review: %s", e)
         return []
 
 
@@ -83,11 +83,11 @@ async def get_new_words(
         result = await session.execute(stmt)
         new_words = list(result.scalars().all())
         
-        logger.info(f"Retrieved {len(new_words)} new words for user {user_id}")
+        logger.info("Retrieved %s new words for user %s", len(new_words), user_id)
         return new_words
         
     except Exception as e:
-        logger.error(f"Error getting new words: {e}")
+        logger.error("Error getting new words: %s", e)
         return []
 
 
@@ -105,6 +105,8 @@ async def update_word_progress(
     - If correct: Move to next box (increase review interval)
     - If incorrect: Move back to box 1 (review tomorrow)
     - Difficulty affects the scheduling slightly
+    
+    The changes are flushed but not committed.
     """
     try:
         # Get or create progress record
@@ -148,7 +150,7 @@ async def update_word_progress(
             progress.leitner_box = new_box
             
             # Calculate next review date based on new box
-            days_until_review = LEITNER_BOXES.get(new_box, 1)
+            days_until_review = LEITNER_INTERVALS[new_box]
             
             # Adjust based on difficulty
             if difficulty == DifficultyLevel.EASY and new_box < 7:
@@ -166,13 +168,13 @@ async def update_word_progress(
         
         progress.last_reviewed_at = progress.updated_at
         
-        await session.commit()
-        await session.refresh(progress)
+        # Flush only; the caller commits this together with its own writes
+        await session.flush()
         
         return progress
         
     except Exception as e:
-        logger.error(f"Error updating word progress: {e}")
+        logger.error("Error updating word progress: %s", e)
         await session.rollback()
         raise
 
@@ -182,33 +184,41 @@ async def get_user_statistics(session: AsyncSession, user_id: int) -> Dict[str,
     Get user's learning statistics.
     """
     try:
-        stmt = select(UserWordProgress).where(UserWordProgress.user_id == user_id)
+        # One grouped query: a row of totals per Leitner box, so no progress
+        # rows are loaded into the ORM
+        today = date.today()
+        stmt = (
+            select(
+                UserWordProgress.leitner_box,
+                func.count(),
+                func.coalesce(func.sum(UserWordProgress.times_reviewed), 0),
+                func.coalesce(func.sum(UserWordProgress.times_correct), 0),
+                func.coalesce(func.sum(UserWordProgress.times_incorrect), 0),
+                func.count().filter(UserWordProgress.next_review_date <= today),
+            )
+            .where(UserWordProgress.user_id == user_id)
+            .group_by(UserWordProgress.leitner_box)
+        )
         result = await session.execute(stmt)
-        all_progress = list(result.scalars().all())
         
-        total_words = len(all_progress)
-        
-        # Count words in each box
         box_counts = {i: 0 for i in range(1, 8)}
-        for p in all_progress:
-            if p.leitner_box in box_counts:
-                box_counts[p.leitner_box] += 1
+        total_words = total_reviews = total_correct = total_incorrect = due_today = 0
+        for box, count, reviewed, correct, incorrect, due in result:
+            # Count words in each box
+            if box in box_counts:
+                box_counts[box] += count
+            total_words += count
+            total_reviews += reviewed
+            total_correct += correct
+            total_incorrect += incorrect
+            due_today += due
         
         # Words mastered (box 7)
         mastered = box_counts.get(7, 0)
         
-        # Total reviews
-        total_reviews = sum(p.times_reviewed for p in all_progress)
-        total_correct = sum(p.times_correct for p in all_progress)
-        total_incorrect = sum(p.times_incorrect for p in all_progress)
-        
         # Accuracy
         accuracy = (total_correct / total_reviews * 100) if total_reviews > 0 else 0
         
-        # Words due for review today
-        today = date.today()
-        due_today = sum(1 for p in all_progress if p.next_review_date <= today)
-        
         return {
             "total_words": total_words,
             "mastered_words": mastered,
@@ -220,7 +230,7 @@ async def get_user_statistics(session: AsyncSession, user_id: int) -> Dict[str,
             "due_today": due_today,
         }
     except Exception as e:
-        logger.error(f"Error getting statistics: {e}")
+        logger.error("Error getting statistics: %s", e)
         return {
             "total_words": 0,
             "mastered_words": 0,
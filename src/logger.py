@@ -2,38 +2,53 @@ import logging
 import sys
 from pathlib import Path
 
-# Create logs directory if it doesn't exist
+# Directory for the log file, created when logging is configured
 LOGS_DIR = Path("logs")
-LOGS_DIR.mkdir(exist_ok=True)
 
-def setup_logger(name: str) -> logging.Logger:
+# Shared by every handler; formatters are stateless
+LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+# Parent of every application logger (src.bot, src.handlers.*, ...)
+APP_LOGGER_NAME = "src"
+
+def configure_logging(level: int = logging.INFO) -> None:
     """
-    Setup and return a logger with file and console handlers
+    Attach console and file handlers to the application's parent logger.
+
+    Call once at startup. Modules only do logging.getLogger(__name__) and
+    inherit these handlers, so each record is written by a single pair of
+    handlers instead of one pair per module. Repeated calls do nothing.
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
+    app_logger = logging.getLogger(APP_LOGGER_NAME)
+    app_logger.setLevel(level)
+
+    # Prevent adding handlers multiple times if logging is already configured
+    if app_logger.handlers:
+        return
 
-    # Prevent adding handlers multiple times if logger is already configured
-    if logger.hasHandlers():
-        return logger
+    LOGS_DIR.mkdir(exist_ok=True)
 
     # Console Handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    console_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    console_handler.setFormatter(console_formatter)
+    console_handler.setLevel(level)
+    console_handler.setFormatter(LOG_FORMATTER)
 
     # File Handler
     file_handler = logging.FileHandler(LOGS_DIR / "app.log", encoding="utf-8")
-    file_handler.setLevel(logging.INFO)
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-    file_handler.setFormatter(file_formatter)
+    file_handler.setLevel(level)
+    file_handler.setFormatter(LOG_FORMATTER)
 
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    app_logger.addHandler(console_handler)
+    app_logger.addHandler(file_handler)
 
-    return logger
+def setup_logger(name: str) -> logging.Logger:
+    """
+    Configure logging if needed and return the named logger.
+
+    Kept for backward compatibility; new code should call
+    configure_logging() once and use logging.getLogger(name).
+    """
+    configure_logging()
+    return logging.getLogger(name)
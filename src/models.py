@@ -14,6 +14,7 @@ from sqlalchemy import (
     ForeignKey,
     UniqueConstraint,
     Index,
+    text,
 )
 from sqlalchemy.orm import (
     DeclarativeBase,
@@ -99,6 +100,7 @@ class Word(Base):
     __table_args__ = (
         UniqueConstraint('word', name='uq_word_lowercase'),
         Index('idx_word_lower', 'word'),
+        Index('uq_words_word_lower', text('lower(word)'), unique=True),
     )
 
     def __repr__(self):
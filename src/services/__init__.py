@@ -21,7 +21,9 @@ from src.services.word_service import (
     get_word_by_text,
 )
 from src.services.learning_service import (
+    SessionWord,
     create_study_session,
+    get_session_words,
     record_review,
     end_session,
 )
@@ -39,7 +41,9 @@ __all__ = [
     "edit_word_field",
     "get_word_by_text",
     # Learning service
+    "SessionWord",
     "create_study_session",
+    "get_session_words",
     "record_review",
     "end_session",
     # Progress service
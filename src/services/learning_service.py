@@ -2,16 +2,24 @@
 Learning service - handles learning session management.
 """
 
+import logging
 from datetime import datetime
-from typing import Tuple, List
-from sqlalchemy import select
+from typing import Dict, NamedTuple, Optional, Tuple, List
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import StudySession, Word
 from src.leitner import get_words_for_review, get_new_words, update_word_progress
-from src.logger import setup_logger
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
+
+
+class SessionWord(NamedTuple):
+    """Display fields of a word, cached for the length of a study session."""
+    word: str
+    definition: str
+    example: Optional[str]
+    translation: Optional[str]
 
 
 async def create_study_session(
@@ -44,17 +52,50 @@ async def create_study_session(
     # Create study session record
     study_session = StudySession(user_id=user_id)
     session.add(study_session)
+    # The flush inside commit assigns the id; sessions do not expire on
+    # commit, so no refresh SELECT is needed to read it
     await session.commit()
-    await session.refresh(study_session)
     
     logger.info(
-        f"Created session {study_session.id} for user {user_id}: "
-        f"{len(review_word_ids)} review, {len(new_word_ids)} new"
+        "Created session %s for user %s: %s review, %s new",
+        study_session.id, user_id, len(review_word_ids), len(new_word_ids)
     )
     
     return study_session.id, review_word_ids, new_word_ids
 
 
+async def get_session_words(
+    session: AsyncSession,
+    word_ids: List[int]
+) -> Dict[int, SessionWord]:
+    """
+    Load the display fields of every word in a study session.
+    
+    One query at session start replaces a SELECT per word shown, so
+    answering and moving through words needs no database round trip.
+    
+    Args:
+        session: Database session
+        word_ids: IDs of the review and new words in the session
+        
+    Returns:
+        Dictionary mapping word ID to its SessionWord. A tuple per word keeps
+        the cache, which lives in user_data for the whole session, compact.
+    """
+    if not word_ids:
+        return {}
+    
+    stmt = select(
+        Word.id, Word.word, Word.definition, Word.example, Word.translation
+    ).where(Word.id.in_(word_ids))
+    result = await session.execute(stmt)
+    
+    return {
+        word_id: SessionWord(word, definition, example, translation)
+        for word_id, word, definition, example, translation in result
+    }
+
+
 async def record_review(
     session: AsyncSession,
     session_id: int,
@@ -79,22 +120,22 @@ async def record_review(
     # Update word progress using Leitner system
     await update_word_progress(session, user_id, word_id, is_correct, difficulty)
     
-    # Update study session statistics
-    stmt = select(StudySession).where(StudySession.id == session_id)
-    result = await session.execute(stmt)
-    study_session = result.scalar_one_or_none()
+    # Update study session statistics in place; one UPDATE instead of
+    # loading the row and writing it back
+    stmt = (
+        update(StudySession)
+        .where(StudySession.id == session_id)
+        .values(
+            words_reviewed=StudySession.words_reviewed + 1,
+            words_correct=StudySession.words_correct + (1 if is_correct else 0),
+            words_incorrect=StudySession.words_incorrect + (0 if is_correct else 1),
+            new_words=StudySession.new_words + (1 if is_new_word else 0),
+        )
+    )
+    await session.execute(stmt)
     
-    if study_session:
-        study_session.words_reviewed += 1
-        if is_correct:
-            study_session.words_correct += 1
-        else:
-            study_session.words_incorrect += 1
-        
-        if is_new_word:
-            study_session.new_words += 1
-        
-        await session.commit()
+    # Progress and statistics are committed together
+    await session.commit()
 
 
 async def end_session(
@@ -111,9 +152,7 @@ async def end_session(
     Returns:
         Dictionary with session statistics
     """
-    stmt = select(StudySession).where(StudySession.id == session_id)
-    result = await session.execute(stmt)
-    study_session = result.scalar_one_or_none()
+    study_session = await session.get(StudySession, session_id)
     
     if study_session:
         study_session.ended_at = datetime.utcnow()
@@ -2,12 +2,12 @@
 Progress service - handles statistics and progress tracking.
 """
 
+import logging
 from typing import Dict, Any
 
 from src.leitner import get_user_statistics as leitner_statistics
-from src.logger import setup_logger
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
 
 
 async def get_user_statistics(session, user_id: int) -> Dict[str, Any]:
@@ -2,15 +2,16 @@
 User service - handles user management and registration logic.
 """
 
+import logging
 from typing import Optional, Tuple
 from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import User
-from src.logger import setup_logger
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
 
 
 async def create_user(
@@ -43,7 +44,7 @@ async def create_user(
     await session.commit()
     await session.refresh(user)
     
-    logger.info(f"Created new user {user_id}")
+    logger.info("Created new user %s", user_id)
     return user
 
 
@@ -57,6 +58,10 @@ async def get_or_create_user(
     """
     Get existing user or create new one.
     
+    A single INSERT ... ON CONFLICT DO UPDATE creates the user or
+    refreshes their profile fields and last_active, so /start costs one
+    round trip instead of a SELECT followed by an INSERT or UPDATE.
+    
     Args:
         session: Database session
         user_id: Telegram user ID
@@ -67,30 +72,33 @@ async def get_or_create_user(
     Returns:
         Tuple of (User object, is_new boolean)
     """
-    stmt = select(User).where(User.id == user_id)
-    result = await session.execute(stmt)
-    user = result.scalar_one_or_none()
-    
-    if not user:
-        user = await create_user(session, user_id, username, first_name, last_name)
-        return user, True
-    
-    # Update user info if changed
-    needs_update = (
-        user.username != username or
-        user.first_name != first_name or
-        user.last_name != last_name
+    stmt = pg_insert(User).values(
+        id=user_id,
+        username=username,
+        first_name=first_name,
+        last_name=last_name,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[User.id],
+        set_={
+            "username": stmt.excluded.username,
+            "first_name": stmt.excluded.first_name,
+            "last_name": stmt.excluded.last_name,
+            "last_active": datetime.utcnow(),
+        },
+    ).returning(
+        User,
+        # xmax is 0 only for a freshly inserted row, not an updated one
+        literal_column("xmax = 0").label("is_new"),
     )
     
-    if needs_update:
-        user.username = username
-        user.first_name = first_name
-        user.last_name = last_name
-        user.last_active = datetime.utcnow()
-        await session.commit()
-        logger.info(f"Updated user info for {user_id}")
+    result = await session.execute(stmt, execution_options={"populate_existing": True})
+    user, is_new = result.one()
+    await session.commit()
     
-    return user, False
+    if is_new:
+        logger.info("Created new user %s", user_id)
+    return user, is_new
 
 
 async def update_user_settings(
@@ -112,9 +120,7 @@ async def update_user_settings(
     Raises:
         ValueError: If user not found
     """
-    stmt = select(User).where(User.id == user_id)
-    result = await session.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await session.get(User, user_id)
     
     if not user:
         raise ValueError(f"User {user_id} not found")
@@ -125,7 +131,7 @@ async def update_user_settings(
     await session.commit()
     await session.refresh(user)
     
-    logger.info(f"Updated settings for user {user_id}")
+    logger.info("Updated settings for user %s", user_id)
     return user
 
 
@@ -146,9 +152,7 @@ async def toggle_reminder(
     Raises:
         ValueError: If user not found
     """
-    stmt = select(User).where(User.id == user_id)
-    result = await session.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await session.get(User, user_id)
     
     if not user:
         raise ValueError(f"User {user_id} not found")
@@ -157,7 +161,7 @@ async def toggle_reminder(
     await session.commit()
     await session.refresh(user)
     
-    logger.info(f"Toggled reminder for user {user_id} to {user.reminder_enabled}")
+    logger.info("Toggled reminder for user %s to %s", user_id, user.reminder_enabled)
     return user, user.reminder_enabled
 
 
@@ -186,9 +190,7 @@ async def set_reminder_time(
     except ValueError:
         raise ValueError(f"Invalid time format: {time_str}")
     
-    stmt = select(User).where(User.id == user_id)
-    result = await session.execute(stmt)
-    user = result.scalar_one_or_none()
+    user = await session.get(User, user_id)
     
     if not user:
         raise ValueError(f"User {user_id} not found")
@@ -197,5 +199,5 @@ async def set_reminder_time(
     await session.commit()
     await session.refresh(user)
     
-    logger.info(f"Set reminder time for user {user_id} to {time_str}")
+    logger.info("Set reminder time for user %s to %s", user_id, time_str)
     return user
@@ -2,15 +2,15 @@
 Word service - handles word management and editing logic.
 """
 
+import logging
 from typing import Optional, Tuple, List
 from datetime import datetime
-from sqlalchemy import select
+from sqlalchemy import func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.models import Word, WordEditHistory
-from src.logger import setup_logger
 
-logger = setup_logger(__name__)
+logger = logging.getLogger(__name__)
 
 
 async def get_word_by_text(session: AsyncSession, word_text: str) -> Optional[Word]:
@@ -24,7 +24,9 @@ async def get_word_by_text(session: AsyncSession, word_text: str) -> Optional[Wo
     Returns:
         Word object if found, None otherwise
     """
-    stmt = select(Word).where(Word.word.ilike(word_text))
+    # Matches the unique index on lower(word), so this is an index lookup
+    # rather than an ILIKE scan (which also treated % and _ as wildcards)
+    stmt = select(Word).where(func.lower(Word.word) == word_text.lower())
     result = await session.execute(stmt)
     return result.scalar_one_or_none()
 
@@ -35,10 +37,14 @@ async def edit_word_field(
     field_name: str,
     new_value: str,
     edited_by: int
-) -> Word:
+) -> str:
     """
     Edit a specific field of a word.
     
+    The word is not loaded first: a single UPDATE ... FROM reads the old
+    value for the history record and returns it, and the history row is
+    inserted in the same transaction.
+    
     Args:
         session: Database session
         word_id: ID of the word to edit
@@ -47,45 +53,50 @@ async def edit_word_field(
         edited_by: User ID who is editing
         
     Returns:
-        Updated Word object
+        The word's text after the edit
         
     Raises:
         ValueError: If word not found or invalid field name
     """
-    # Get word from database
-    stmt = select(Word).where(Word.id == word_id)
-    result = await session.execute(stmt)
-    word = result.scalar_one_or_none()
-    
-    if not word:
-        raise ValueError(f"Word {word_id} not found")
-    
     # Validate field name
     valid_fields = ['word', 'definition', 'example', 'translation']
     if field_name not in valid_fields:
         raise ValueError(f"Invalid field name: {field_name}")
     
-    # Get old value for history
-    old_value = getattr(word, field_name, None)
+    field = getattr(Word, field_name)
     
-    # Update word
-    setattr(word, field_name, new_value)
-    word.updated_at = datetime.utcnow()
+    # Old value, read in the same statement that overwrites it
+    old = (
+        select(Word.id, field.label("old_value"))
+        .where(Word.id == word_id)
+        .subquery("old")
+    )
+    stmt = (
+        update(Word)
+        .where(Word.id == old.c.id)
+        .values({field_name: new_value, "updated_at": datetime.utcnow()})
+        .returning(old.c.old_value, Word.word)
+        .execution_options(synchronize_session=False)
+    )
+    row = (await session.execute(stmt)).one_or_none()
+    
+    if row is None:
+        raise ValueError(f"Word {word_id} not found")
     
     # Record edit history
-    edit_history = WordEditHistory(
-        word_id=word_id,
-        edited_by=edited_by,
-        field_name=field_name,
-        old_value=old_value,
-        new_value=new_value
+    await session.execute(
+        insert(WordEditHistory).values(
+            word_id=word_id,
+            edited_by=edited_by,
+            field_name=field_name,
+            old_value=row.old_value,
+            new_value=new_value,
+        )
     )
-    session.add(edit_history)
     await session.commit()
-    await session.refresh(word)
     
-    logger.info(f"User {edited_by} updated word {word_id} field {field_name}")
-    return word
+    logger.info("User %s updated word %s field %s", edited_by, word_id, field_name)
+    return row.word
 
 
 async def create_word_from_excel(
@@ -126,5 +137,5 @@ async def create_word_from_excel(
     session.add(new_word)
     await session.commit()
     
-    logger.info(f"Created word '{word_text}' by user {added_by}")
+    logger.info("Created word '%s' by user %s", word_text, added_by)
     return True, f"Added word '{word_text}'"
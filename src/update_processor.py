@@ -0,0 +1,110 @@
+"""
+Update processor for the English Learning Bot.
+
+Updates from different users are processed concurrently, while updates
+from the same user are processed one at a time, in arrival order.
+"""
+
+import asyncio
+import logging
+import sys
+import weakref
+from typing import Any, Awaitable, Optional
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+logger = logging.getLogger(__name__)
+
+
+def _serialization_key(update: object) -> Optional[int]:
+    """Return the id updates are serialized on: the user, else the chat."""
+    if not isinstance(update, Update):
+        return None
+    if update.effective_user is not None:
+        return update.effective_user.id
+    if update.effective_chat is not None:
+        return update.effective_chat.id
+    return None
+
+
+# Handed to BaseUpdateProcessor, whose semaphore is taken before
+# do_process_update runs; the real limit is applied after the per-user lock
+_UNBOUNDED = sys.maxsize
+
+
+class UserSerializingUpdateProcessor(BaseUpdateProcessor):
+    """
+    Run at most max_concurrent_updates updates at once, one per user.
+
+    Handlers keep per-user state in user_data (the learning session,
+    word edits) and read-modify-write it, so two updates from the same
+    user running together (e.g. a double tap on a button) would race.
+    A lock per user serializes them, whichever chat they come from; this
+    also makes dropping an emptied user_data (release_user_data) safe,
+    as no other update of the user can hold the dict meanwhile. Updates
+    without a user fall back to their chat; ones with neither are not
+    serialized.
+
+    An update first waits for its user's lock and only then takes one of
+    the concurrency slots, so a user sending many updates at once queues
+    behind their own lock without holding slots other users need.
+    """
+
+    __slots__ = ("_locks", "_limit", "_slots", "_running")
+
+    def __init__(self, max_concurrent_updates: int):
+        if max_concurrent_updates < 1:
+            raise ValueError("`max_concurrent_updates` must be a positive integer!")
+        # The base class sizes its semaphore from max_concurrent_updates,
+        # which reads _limit; it is unbounded until the base is set up
+        self._limit = _UNBOUNDED
+        super().__init__(_UNBOUNDED)
+        self._limit = max_concurrent_updates
+        self._slots = asyncio.Semaphore(max_concurrent_updates)
+        self._running = 0
+        # Entries disappear once no update holds or awaits the lock
+        self._locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = (
+            weakref.WeakValueDictionary()
+        )
+
+    @property
+    def max_concurrent_updates(self) -> int:
+        """The maximum number of updates processed at the same time."""
+        return self._limit
+
+    @property
+    def current_concurrent_updates(self) -> int:
+        """The number of updates being processed (not waiting for a lock)."""
+        return self._running
+
+    def _get_lock(self, key: int) -> asyncio.Lock:
+        """Return the lock serializing updates for the given user or chat."""
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    async def _run(self, coroutine: Awaitable[Any]) -> None:
+        """Await the update's coroutine in one of the concurrency slots."""
+        async with self._slots:
+            self._running += 1
+            try:
+                await coroutine
+            finally:
+                self._running -= 1
+
+    async def do_process_update(self, update: object, coroutine: Awaitable[Any]) -> None:
+        key = _serialization_key(update)
+        if key is None:
+            await self._run(coroutine)
+            return
+
+        async with self._get_lock(key):
+            await self._run(coroutine)
+
+    async def initialize(self) -> None:
+        """Nothing to set up."""
+
+    async def shutdown(self) -> None:
+        """Nothing to tear down."""